@@ -2,6 +2,8 @@
 Taiyo - A modern Python client for Apache Solr.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .types import (
     SolrDocument,
     SolrError,
@@ -27,6 +29,10 @@ from .params import (
     FacetParamsConfig,
     FacetMethod,
     FacetSort,
+    RangeInclude,
+    RangeMethod,
+    RangeOther,
+    RangeSpec,
     GroupParamsConfig,
     HighlightParamsConfig,
     HighlightMethod,
@@ -35,19 +41,22 @@ from .params import (
     FragListBuilder,
     FragmentsBuilder,
     Fragmenter,
-    MoreLikeThisParamsConfig,
-)
-from .parsers import (
-    KNNQueryParser,
-    KNNTextToVectorQueryParser,
-    VectorSimilarityQueryParser,
-    StandardParser,
-    DisMaxQueryParser,
-    ExtendedDisMaxQueryParser,
-    GeoFilterQueryParser,
-    TermsQueryParser,
+    Formatter,
 )
 
+if TYPE_CHECKING:
+    from .params import MoreLikeThisParamsConfig
+    from .parsers import (
+        KNNQueryParser,
+        KNNTextToVectorQueryParser,
+        VectorSimilarityQueryParser,
+        StandardParser,
+        DisMaxQueryParser,
+        ExtendedDisMaxQueryParser,
+        GeoFilterQueryParser,
+        TermsQueryParser,
+    )
+
 __version__ = "0.1.0"
 __all__ = [
     # client
@@ -83,6 +92,10 @@ __all__ = [
     "FacetParamsConfig",
     "FacetMethod",
     "FacetSort",
+    "RangeInclude",
+    "RangeMethod",
+    "RangeOther",
+    "RangeSpec",
     "GroupParamsConfig",
     "HighlightParamsConfig",
     "HighlightMethod",
@@ -91,5 +104,22 @@ __all__ = [
     "FragListBuilder",
     "FragmentsBuilder",
     "Fragmenter",
+    "Formatter",
     "MoreLikeThisParamsConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve parsers and MoreLikeThisParamsConfig, which are imported lazily."""
+    if name == "MoreLikeThisParamsConfig":
+        from .params import MoreLikeThisParamsConfig
+
+        globals()[name] = MoreLikeThisParamsConfig
+        return MoreLikeThisParamsConfig
+    if name in __all__:
+        from . import parsers
+
+        value = getattr(parsers, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,31 @@
-from typing import Any, Dict, Optional, Union, Type, TYPE_CHECKING, TypeVar, Generic
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    Type,
+    TYPE_CHECKING,
+    TypeVar,
+    Generic,
+)
 from abc import abstractmethod
 from urllib.parse import urljoin
-from pydantic import ValidationError
+from functools import cache
+from pydantic import TypeAdapter, ValidationError
 
 from taiyo.parsers.base import BaseQueryParser
-from ..types import SolrResponse, DocumentT, SolrMoreLikeThisResult, SolrFacetResult
+from ..types import (
+    SolrDocument,
+    SolrResponse,
+    DocumentT,
+    SolrMoreLikeThisResult,
+    SolrFacetResult,
+)
 from httpx import Client, AsyncClient
 
 if TYPE_CHECKING:
@@ -13,6 +34,42 @@ if TYPE_CHECKING:
 ClientT = TypeVar("ClientT", Client, AsyncClient)
 
 
+def _delete_by_ids(query: Optional[str], ids: Any) -> Any:
+    return ids
+
+
+def _delete_by_id_list(query: Optional[str], ids: list[str]) -> Union[str, list[str]]:
+    return ids[0] if len(ids) == 1 else ids
+
+
+def _delete_by_query(query: Optional[str], ids: Any) -> Dict[str, Any]:
+    return {"query": query}
+
+
+def _delete_combined(query: Optional[str], ids: Any) -> Dict[str, Any]:
+    return {"query": query, "id": ids}
+
+
+@cache
+def _document_adapter(document_model: type) -> TypeAdapter[Any]:
+    """List validator for a document model, built on first use."""
+    return TypeAdapter(List[document_model])  # type: ignore[valid-type]
+
+
+# Keyed on (query given, type of non-empty ids or None).
+_DELETE_DISPATCH: Dict[
+    Tuple[bool, Optional[type]],
+    Callable[[Optional[str], Any], Union[str, list[str], Dict[str, Any]]],
+] = {
+    (False, str): _delete_by_ids,
+    (False, list): _delete_by_id_list,
+    (True, None): _delete_by_query,
+    (True, str): _delete_combined,
+    (True, list): _delete_combined,
+    (False, None): _delete_combined,
+}
+
+
 class BaseSolrClient(Generic[ClientT]):
     """
     Base class for Solr clients.
@@ -25,6 +82,9 @@ class BaseSolrClient(Generic[ClientT]):
         verify: SSL certificate verification (default: True)
     """
 
+    # Transport reused by every new client of the class, see configure_shared_transport().
+    _shared_transport: ClassVar[Optional[Any]] = None
+
     def __init__(
         self,
         base_url: str,
@@ -77,6 +137,31 @@ class BaseSolrClient(Generic[ClientT]):
         """Make a request to Solr and handle the response."""
         pass
 
+    @staticmethod
+    def _validate_documents(
+        docs: List[Dict[str, Any]],
+        document_model: Type[DocumentT],
+    ) -> List[DocumentT]:
+        """Validate raw Solr documents into document_model instances in one pass.
+
+        Falls back to validating each document on its own, by field name and then
+        by alias, when the batch as a whole fails.
+        """
+        adapter = _document_adapter(document_model)
+        try:
+            validated: List[DocumentT] = adapter.validate_python(docs, by_name=True)
+            return validated
+        except ValidationError:
+            pass
+
+        parsed: List[DocumentT] = []
+        for doc in docs:
+            try:
+                parsed.append(document_model.model_validate(doc, by_name=True))
+            except ValidationError:
+                parsed.append(document_model.model_validate(doc, by_alias=True))
+        return parsed
+
     @staticmethod
     def _build_search_response(
         response: Dict[str, Any],
@@ -94,13 +179,9 @@ class BaseSolrClient(Generic[ClientT]):
 
         if "response" in response:
             # Standard search response
-            for doc in response["response"]["docs"]:
-                try:
-                    docs.append(document_model.model_validate(doc, by_name=True))
-                except ValidationError:
-                    docs.append(document_model.model_validate(doc, by_alias=True))
-                except Exception:
-                    raise
+            docs = BaseSolrClient._validate_documents(
+                response["response"]["docs"], document_model
+            )
             num_found = response["response"]["numFound"]
             start = response["response"]["start"]
         elif "grouped" in response:
@@ -112,17 +193,11 @@ class BaseSolrClient(Generic[ClientT]):
                 if "groups" in grouped_data:
                     for g in grouped_data.get("groups", []):
                         doclist = g.get("doclist", {})
-                        for doc in doclist.get("docs", []):
-                            try:
-                                docs.append(
-                                    document_model.model_validate(doc, by_name=True)
-                                )
-                            except ValidationError:
-                                docs.append(
-                                    document_model.model_validate(doc, by_alias=True)
-                                )
-                            except Exception:
-                                raise
+                        docs.extend(
+                            BaseSolrClient._validate_documents(
+                                doclist.get("docs", []), document_model
+                            )
+                        )
                         num_found += int(doclist.get("numFound", 0))
                         groups.append(
                             SolrGroup(
@@ -139,17 +214,11 @@ class BaseSolrClient(Generic[ClientT]):
                     )
                 elif "doclist" in grouped_data:
                     doclist = grouped_data.get("doclist", {})
-                    for doc in doclist.get("docs", []):
-                        try:
-                            docs.append(
-                                document_model.model_validate(doc, by_name=True)
-                            )
-                        except ValidationError:
-                            docs.append(
-                                document_model.model_validate(doc, by_alias=True)
-                            )
-                        except Exception:
-                            raise
+                    docs.extend(
+                        BaseSolrClient._validate_documents(
+                            doclist.get("docs", []), document_model
+                        )
+                    )
                     num_found += int(doclist.get("numFound", 0))
                     grouped_fields[group_field] = SolrGroupedField(
                         matches=grouped_data.get("matches", 0),
@@ -181,18 +250,9 @@ class BaseSolrClient(Generic[ClientT]):
                     continue
 
                 payload_docs = payload.get("docs", []) or []
-                parsed_docs: list[DocumentT] = []
-                for doc in payload_docs:
-                    try:
-                        parsed_docs.append(
-                            document_model.model_validate(doc, by_name=True)
-                        )
-                    except ValidationError:
-                        parsed_docs.append(
-                            document_model.model_validate(doc, by_alias=True)
-                        )
-                    except Exception:
-                        raise
+                parsed_docs = BaseSolrClient._validate_documents(
+                    payload_docs, document_model
+                )
 
                 if isinstance(raw_interesting_terms, dict):
                     doc_interesting_terms = raw_interesting_terms.get(doc_id)
@@ -227,20 +287,31 @@ class BaseSolrClient(Generic[ClientT]):
         ids: Optional[Union[str, list[str]]] = None,
     ) -> Union[str, list[str], Dict[str, Any]]:
         """Build delete command according to Solr specification."""
-        if ids and not query:
-            if isinstance(ids, str):
-                return ids
-            if isinstance(ids, list) and len(ids) == 1:
-                return ids[0]
-            return ids
-
-        if query and not ids:
-            return {"query": query}
-
-        return {
-            "query": query,
-            "id": ids if isinstance(ids, str) else ids,
-        }
+        key = (bool(query), type(ids) if ids else None)
+        build = _DELETE_DISPATCH.get(key)
+        if build is None:
+            build = _delete_by_ids if ids and not query else _delete_combined
+        return build(query, ids)
+
+    @staticmethod
+    def _batch_ids(ids: List[str], batch_size: int) -> List[List[str]]:
+        """Split IDs into consecutive batches of at most batch_size."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        return [ids[i : i + batch_size] for i in range(0, len(ids), batch_size)]
+
+    @staticmethod
+    def _iter_documents_json(documents: List[SolrDocument]) -> Iterator[bytes]:
+        """Encode documents as a JSON array one document at a time.
+
+        Used for streaming uploads so the full request body is never held in memory.
+        """
+        yield b"["
+        for index, doc in enumerate(documents):
+            if index:
+                yield b","
+            yield doc.model_dump_json(exclude_unset=True).encode()
+        yield b"]"
 
     @staticmethod
     def _build_search_params(
@@ -1,5 +1,6 @@
+import asyncio
 import httpx
-from typing import Any, Dict, List, Optional, Union, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Union, Type
 from typing_extensions import Self
 
 from taiyo.parsers.base import BaseQueryParser
@@ -9,6 +10,34 @@ from .base import BaseSolrClient
 from ..schema import SolrFieldType, SolrField, SolrDynamicField
 
 
+class _SharedAsyncTransport(httpx.AsyncHTTPTransport):
+    """Async transport shared between clients; closing a client leaves it open."""
+
+    def __init__(self, **transport_options: Any) -> None:
+        super().__init__(**transport_options)
+        self.http2 = bool(transport_options.get("http2", False))
+
+    async def aclose(self) -> None:
+        return None
+
+    async def release(self) -> None:
+        await super().aclose()
+
+
+class _SharedTransport(httpx.HTTPTransport):
+    """Transport shared between clients; closing a client leaves it open."""
+
+    def __init__(self, **transport_options: Any) -> None:
+        super().__init__(**transport_options)
+        self.http2 = bool(transport_options.get("http2", False))
+
+    def close(self) -> None:
+        return None
+
+    def release(self) -> None:
+        super().close()
+
+
 class AsyncSolrClient(BaseSolrClient[httpx.AsyncClient]):
     """
     Asynchronous Python client for Apache Solr.
@@ -18,6 +47,7 @@ class AsyncSolrClient(BaseSolrClient[httpx.AsyncClient]):
         auth: Authentication method to use (optional)
         timeout: Request timeout in seconds
         verify: SSL certificate verification (default: True)
+        http2: Enable HTTP/2 (default: False)
         **client_options: Additional options to pass to the httpx client
 
     Usage:
@@ -40,6 +70,7 @@ class AsyncSolrClient(BaseSolrClient[httpx.AsyncClient]):
         auth: Optional[SolrAuth] = None,
         timeout: float = 10.0,
         verify: Union[bool, str] = True,
+        http2: bool = False,
         **client_options: Any,
     ):
         """
@@ -48,11 +79,20 @@ class AsyncSolrClient(BaseSolrClient[httpx.AsyncClient]):
             auth: Authentication method to use (optional).
             timeout: Request timeout in seconds. Defaults to 10.
             verify: SSL certificate verification. Can be True (default), False, or path to CA bundle.
+            http2: Negotiate HTTP/2 so concurrent requests share one connection.
+                Requires the `http2` extra. Defaults to False.
             **client_options: Additional options to pass to the httpx client.
         """
         super().__init__(base_url, auth, timeout, verify)
+        if self._shared_transport is not None and "transport" not in client_options:
+            if http2 != self._shared_transport.http2:
+                raise ValueError(
+                    "http2 must match the shared transport; set it in "
+                    "configure_shared_transport() instead."
+                )
+            client_options["transport"] = self._shared_transport
         self._client = httpx.AsyncClient(
-            timeout=timeout, verify=verify, **client_options
+            timeout=timeout, verify=verify, http2=http2, **client_options
         )
 
         if auth:
@@ -68,6 +108,44 @@ class AsyncSolrClient(BaseSolrClient[httpx.AsyncClient]):
         """Close the underlying HTTP client."""
         await self._client.aclose()
 
+    @classmethod
+    def configure_shared_transport(
+        cls, **transport_options: Any
+    ) -> httpx.AsyncHTTPTransport:
+        """
+        Share one connection pool between all clients created afterwards.
+
+        Clients constructed after this call reuse the same transport, so keep-alive
+        connections and TLS sessions survive across client instances. Passing
+        `transport` in `client_options` still overrides it per client.
+
+        Args:
+            **transport_options: Options for `httpx.AsyncHTTPTransport`, e.g. `limits`,
+                `retries`, `verify` or `http2`. SSL and HTTP/2 settings come from here
+                rather than from the `verify` and `http2` arguments of each client; a
+                client created with a different `http2` raises ValueError.
+
+        Returns:
+            The shared transport.
+
+        Example:
+            ```python
+            AsyncSolrClient.configure_shared_transport(
+                limits=httpx.Limits(max_connections=50), retries=2
+            )
+            ```
+        """
+        cls._shared_transport = _SharedAsyncTransport(**transport_options)
+        return cls._shared_transport
+
+    @classmethod
+    async def close_shared_transport(cls) -> None:
+        """Close the shared transport and stop sharing it with new clients."""
+        transport = cls._shared_transport
+        cls._shared_transport = None
+        if isinstance(transport, _SharedAsyncTransport):
+            await transport.release()
+
     async def _request(  # type: ignore[override]
         self,
         method: str,
@@ -160,6 +238,7 @@ class AsyncSolrClient(BaseSolrClient[httpx.AsyncClient]):
         self,
         documents: Union[SolrDocument, List[SolrDocument]],
         commit: bool = True,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         """
         Add one or more documents to the index.
@@ -167,6 +246,7 @@ class AsyncSolrClient(BaseSolrClient[httpx.AsyncClient]):
         Args:
             documents: A single document or list of documents to add. Can be dicts or instances of the document_model (which must be a subclass of SolrDocument).
             commit: Whether to commit the changes immediately
+            stream: Encode and upload documents one at a time instead of building the whole JSON body in memory. Useful for very large batches.
 
         Returns:
             Response from Solr
@@ -178,12 +258,25 @@ class AsyncSolrClient(BaseSolrClient[httpx.AsyncClient]):
             documents = [documents]
 
         params = {"commit": "true"} if commit else {}
-        content = [doc.model_dump(exclude_unset=True) for doc in documents]
-        response = await self._client.post(
-            url=self._build_url("update/json/docs"),
-            params=params,
-            json=content,
-        )
+        if stream:
+            docs = documents
+
+            async def content() -> AsyncIterator[bytes]:
+                for chunk in self._iter_documents_json(docs):
+                    yield chunk
+
+            response = await self._client.post(
+                url=self._build_url("update/json/docs"),
+                params=params,
+                content=content(),
+                headers={"Content-Type": "application/json"},
+            )
+        else:
+            response = await self._client.post(
+                url=self._build_url("update/json/docs"),
+                params=params,
+                json=[doc.model_dump(exclude_unset=True) for doc in documents],
+            )
         result: Dict[str, Any] = response.json()
         return result
 
@@ -241,6 +334,52 @@ class AsyncSolrClient(BaseSolrClient[httpx.AsyncClient]):
             json={"delete": delete_cmd},
         )
 
+    async def delete_many(
+        self,
+        ids: List[str],
+        batch_size: int = 1000,
+        max_concurrency: int = 8,
+        commit: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Delete a large number of documents by ID in concurrent batches.
+
+        IDs are split into batches of `batch_size` and deleted with at most
+        `max_concurrency` requests in flight. Changes are committed once after all
+        batches have been sent.
+
+        Args:
+            ids: IDs of the documents to delete
+            batch_size: Maximum number of IDs per delete request
+            max_concurrency: Maximum number of delete requests in flight
+            commit: Whether to commit the changes once all batches are deleted
+
+        Returns:
+            Responses from Solr, one per batch
+
+        Example:
+            ```python
+            await client.delete_many(ids=stale_ids, batch_size=500)
+            ```
+        """
+        if not self.collection:
+            raise ValueError("collection needs to be specified via set_collection().")
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def delete_batch(batch: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.delete(ids=batch, commit=False)
+
+        responses = await asyncio.gather(
+            *(delete_batch(batch) for batch in self._batch_ids(ids, batch_size))
+        )
+        if commit:
+            await self.commit()
+        return list(responses)
+
     async def commit(self) -> Dict[str, Any]:
         """
         Commit pending changes to the index.
@@ -406,6 +545,7 @@ class SolrClient(BaseSolrClient[httpx.Client]):
         auth: Authentication method to use (optional)
         timeout: Request timeout in seconds
         verify: SSL certificate verification (default: True)
+        http2: Enable HTTP/2 (default: False)
         **client_options: Additional options to pass to the httpx client
 
     Usage:
@@ -428,6 +568,7 @@ class SolrClient(BaseSolrClient[httpx.Client]):
         auth: Optional[SolrAuth] = None,
         timeout: float = 10.0,
         verify: Union[bool, str] = True,
+        http2: bool = False,
         **client_options: Any,
     ):
         """
@@ -436,10 +577,21 @@ class SolrClient(BaseSolrClient[httpx.Client]):
             auth: Authentication method to use (optional).
             timeout: Request timeout in seconds. Defaults to 10.
             verify: SSL certificate verification. Can be True (default), False, or path to CA bundle.
+            http2: Negotiate HTTP/2 so concurrent requests share one connection.
+                Requires the `http2` extra. Defaults to False.
             **client_options: Additional options to pass to the httpx client.
         """
         super().__init__(base_url, auth, timeout, verify)
-        self._client = httpx.Client(timeout=timeout, verify=verify, **client_options)
+        if self._shared_transport is not None and "transport" not in client_options:
+            if http2 != self._shared_transport.http2:
+                raise ValueError(
+                    "http2 must match the shared transport; set it in "
+                    "configure_shared_transport() instead."
+                )
+            client_options["transport"] = self._shared_transport
+        self._client = httpx.Client(
+            timeout=timeout, verify=verify, http2=http2, **client_options
+        )
 
         if auth:
             auth.apply(self)
@@ -454,6 +606,44 @@ class SolrClient(BaseSolrClient[httpx.Client]):
         """Close the underlying HTTP client."""
         self._client.close()
 
+    @classmethod
+    def configure_shared_transport(
+        cls, **transport_options: Any
+    ) -> httpx.HTTPTransport:
+        """
+        Share one connection pool between all clients created afterwards.
+
+        Clients constructed after this call reuse the same transport, so keep-alive
+        connections and TLS sessions survive across client instances. Passing
+        `transport` in `client_options` still overrides it per client.
+
+        Args:
+            **transport_options: Options for `httpx.HTTPTransport`, e.g. `limits`,
+                `retries`, `verify` or `http2`. SSL and HTTP/2 settings come from here
+                rather than from the `verify` and `http2` arguments of each client; a
+                client created with a different `http2` raises ValueError.
+
+        Returns:
+            The shared transport.
+
+        Example:
+            ```python
+            SolrClient.configure_shared_transport(
+                limits=httpx.Limits(max_connections=50), retries=2
+            )
+            ```
+        """
+        cls._shared_transport = _SharedTransport(**transport_options)
+        return cls._shared_transport
+
+    @classmethod
+    def close_shared_transport(cls) -> None:
+        """Close the shared transport and stop sharing it with new clients."""
+        transport = cls._shared_transport
+        cls._shared_transport = None
+        if isinstance(transport, _SharedTransport):
+            transport.release()
+
     def _request(
         self,
         method: str,
@@ -546,6 +736,7 @@ class SolrClient(BaseSolrClient[httpx.Client]):
         self,
         documents: Union[SolrDocument, List[SolrDocument]],
         commit: bool = True,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         """
         Add one or more documents to the index.
@@ -553,6 +744,7 @@ class SolrClient(BaseSolrClient[httpx.Client]):
         Args:
             documents: A single document or list of documents to add. Can be dicts or instances of the document_model (which must be a subclass of SolrDocument).
             commit: Whether to commit the changes immediately
+            stream: Encode and upload documents one at a time instead of building the whole JSON body in memory. Useful for very large batches.
 
         Returns:
             Response from Solr
@@ -561,12 +753,19 @@ class SolrClient(BaseSolrClient[httpx.Client]):
             documents = [documents]
 
         params = {"commit": "true"} if commit else {}
-        content = [doc.model_dump(exclude_unset=True) for doc in documents]
-        response = self._client.post(
-            url=self._build_url(f"{self.collection}/update/json/docs"),
-            params=params,
-            json=content,
-        )
+        if stream:
+            response = self._client.post(
+                url=self._build_url(f"{self.collection}/update/json/docs"),
+                params=params,
+                content=self._iter_documents_json(documents),
+                headers={"Content-Type": "application/json"},
+            )
+        else:
+            response = self._client.post(
+                url=self._build_url(f"{self.collection}/update/json/docs"),
+                params=params,
+                json=[doc.model_dump(exclude_unset=True) for doc in documents],
+            )
         response.raise_for_status()
         result: Dict[str, Any] = response.json()
         return result
@@ -625,6 +824,42 @@ class SolrClient(BaseSolrClient[httpx.Client]):
             json={"delete": delete_cmd},
         )
 
+    def delete_many(
+        self,
+        ids: List[str],
+        batch_size: int = 1000,
+        commit: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Delete a large number of documents by ID in batches.
+
+        IDs are split into batches of `batch_size` and deleted one request at a
+        time. Changes are committed once after all batches have been sent.
+
+        Args:
+            ids: IDs of the documents to delete
+            batch_size: Maximum number of IDs per delete request
+            commit: Whether to commit the changes once all batches are deleted
+
+        Returns:
+            Responses from Solr, one per batch
+
+        Example:
+            ```python
+            client.delete_many(ids=stale_ids, batch_size=500)
+            ```
+        """
+        if not self.collection:
+            raise ValueError("collection needs to be specified via set_collection().")
+
+        responses = [
+            self.delete(ids=batch, commit=False)
+            for batch in self._batch_ids(ids, batch_size)
+        ]
+        if commit:
+            self.commit()
+        return responses
+
     def commit(self) -> Dict[str, Any]:
         """
         Commit pending changes to the index.
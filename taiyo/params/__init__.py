@@ -1,18 +1,33 @@
+from typing import TYPE_CHECKING, Any
+
 from .mixins.common import CommonParamsMixin
 from .mixins.dense_vector_search import DenseVectorSearchParamsMixin
 from .mixins.spatial_search import SpatialSearchParamsMixin
-from .configs.facet import FacetParamsConfig, FacetMethod, FacetSort
+from .configs.facet import (
+    FacetParamsConfig,
+    FacetMethod,
+    FacetSort,
+    RangeInclude,
+    RangeMethod,
+    RangeOther,
+    RangeSpec,
+)
 from .configs.group import GroupParamsConfig
 from .configs.highlight import (
     HighlightParamsConfig,
+    HighlightParamsDict,
+    highlight_params_to_solr,
     HighlightMethod,
     HighlightEncoder,
     BreakIteratorType,
     FragListBuilder,
     FragmentsBuilder,
     Fragmenter,
+    Formatter,
 )
-from .configs.more_like_this import MoreLikeThisParamsConfig
+
+if TYPE_CHECKING:
+    from .configs.more_like_this import MoreLikeThisParamsConfig
 
 __all__ = [
     "CommonParamsMixin",
@@ -21,13 +36,30 @@ __all__ = [
     "FacetParamsConfig",
     "FacetMethod",
     "FacetSort",
+    "RangeInclude",
+    "RangeMethod",
+    "RangeOther",
+    "RangeSpec",
     "GroupParamsConfig",
     "HighlightParamsConfig",
+    "HighlightParamsDict",
+    "highlight_params_to_solr",
     "HighlightMethod",
     "HighlightEncoder",
     "BreakIteratorType",
     "FragListBuilder",
     "FragmentsBuilder",
     "Fragmenter",
+    "Formatter",
     "MoreLikeThisParamsConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import MoreLikeThisParamsConfig on first access."""
+    if name == "MoreLikeThisParamsConfig":
+        from .configs.more_like_this import MoreLikeThisParamsConfig
+
+        globals()[name] = MoreLikeThisParamsConfig
+        return MoreLikeThisParamsConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING, Any
+
 from .facet import FacetParamsConfig
 from .group import GroupParamsConfig
 from .highlight import HighlightParamsConfig
-from .more_like_this import MoreLikeThisParamsConfig
+
+if TYPE_CHECKING:
+    from .more_like_this import MoreLikeThisParamsConfig
 
 __all__ = [
     "FacetParamsConfig",
@@ -9,3 +13,13 @@ __all__ = [
     "HighlightParamsConfig",
     "MoreLikeThisParamsConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import MoreLikeThisParamsConfig on first access."""
+    if name == "MoreLikeThisParamsConfig":
+        from .more_like_this import MoreLikeThisParamsConfig
+
+        globals()[name] = MoreLikeThisParamsConfig
+        return MoreLikeThisParamsConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
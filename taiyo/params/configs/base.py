@@ -1,6 +1,38 @@
 """Base configuration for Solr query parameters."""
 
-from pydantic import BaseModel, ConfigDict
+import json
+import re
+import sys
+from enum import Enum
+from functools import cache, lru_cache
+from hashlib import blake2b
+from importlib.resources import files
+from types import MappingProxyType
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict, PrivateAttr
+from pydantic.json_schema import (
+    DEFAULT_REF_TEMPLATE,
+    GenerateJsonSchema,
+    JsonSchemaMode,
+)
+from typing_extensions import Self
 
 
 class ParamsConfig(BaseModel):
@@ -13,8 +45,314 @@ class ParamsConfig(BaseModel):
         enable_key: The Solr parameter key that enables this feature.
     """
 
+    # Field values live in __dict__; subclasses declaring empty slots skip __weakref__.
+    __slots__ = ()
+
     enable_key: str
 
     model_config = ConfigDict(
-        populate_by_name=True, validate_by_name=True, validate_by_alias=False
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+        populate_by_name=True,
+        validate_by_name=True,
+        validate_by_alias=False,
     )
+
+    # JSON file next to the subclass module holding field descriptions. They are
+    # merged into model_json_schema() on demand instead of living on the fields.
+    _DESCRIPTIONS_FILE: ClassVar[Optional[str]] = None
+    # (field name, Solr parameter name) pairs, built once per subclass.
+    _EMIT: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+    # Solr parameter name to field name, the reverse of _EMIT.
+    _ALIAS_TO_NAME: ClassVar[Mapping[str, str]] = MappingProxyType({})
+    # Fields typed as an Enum or Literal, whose enum members, which only
+    # unvalidated configs hold, are sent as values.
+    _ENUM_FIELDS: ClassVar[FrozenSet[str]] = frozenset()
+    # Whether the class declares serializers, which only model_dump() applies.
+    _MODEL_DUMP: ClassVar[bool] = False
+
+    # Result of the first to_solr_params() call. Configs are frozen, so it only
+    # has to be reset on copies.
+    _serialized: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    # Result of the first to_json_fragment() call, reset alongside _serialized.
+    _json_fragment: Optional[bytes] = PrivateAttr(default=None)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._EMIT = tuple(
+            (name, sys.intern(field.alias or name))
+            for name, field in cls.model_fields.items()
+            if name != "enable_key"
+        )
+        cls._ALIAS_TO_NAME = MappingProxyType(
+            {alias: name for name, alias in cls._EMIT}
+        )
+        cls._ENUM_FIELDS = frozenset(
+            name
+            for name, field in cls.model_fields.items()
+            if _is_enum_annotation(field.annotation)
+        )
+        decorators = cls.__pydantic_decorators__
+        cls._MODEL_DUMP = bool(
+            decorators.field_serializers or decorators.model_serializers
+        )
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied._serialized = None
+        copied._json_fragment = None
+        return copied
+
+    @classmethod
+    def model_json_schema(
+        cls,
+        by_alias: bool = True,
+        ref_template: str = DEFAULT_REF_TEMPLATE,
+        schema_generator: type[GenerateJsonSchema] = GenerateJsonSchema,
+        mode: JsonSchemaMode = "validation",
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Generate the JSON schema, with field descriptions from _DESCRIPTIONS_FILE."""
+        schema = super().model_json_schema(
+            by_alias=by_alias,
+            ref_template=ref_template,
+            schema_generator=schema_generator,
+            mode=mode,
+            **kwargs,
+        )
+        if cls._DESCRIPTIONS_FILE is None:
+            return schema
+        package = cls.__module__.rpartition(".")[0]
+        properties = schema.get("properties", {})
+        for name, description in _load_descriptions(
+            package, cls._DESCRIPTIONS_FILE
+        ).items():
+            for key in (cls.model_fields[name].alias, name):
+                if key in properties:
+                    properties[key]["description"] = description
+        return schema
+
+    @classmethod
+    def from_trusted(cls, **kwargs: Any) -> Self:
+        """Build a config from already-typed values without running validation.
+
+        Intended for configs assembled from constants or internal code. Values are
+        stored as given, so callers must pass Python field names (not `hl.*` style
+        aliases) and correctly typed values.
+
+        Args:
+            **kwargs: Field values keyed by field name.
+
+        Returns:
+            The config instance.
+
+        Example:
+            ```python
+            config = HighlightParamsConfig.from_trusted(fields=["title"], fragment_size=150)
+            ```
+        """
+        return cast(Self, cls.model_construct(**kwargs))
+
+    @classmethod
+    def from_solr_dict(
+        cls, params: Mapping[str, Any], *, trusted: bool = False
+    ) -> Self:
+        """Build a config from Solr parameters, e.g. `{"hl.fl": "title"}`.
+
+        Keys are translated to field names up front, so validation does not have to
+        resolve aliases. The enable flag (e.g. `hl`) is ignored, and keys that are
+        already field names are passed through.
+
+        Args:
+            params: Solr parameters keyed by parameter name.
+            trusted: Skip validation, as with `from_trusted()`.
+
+        Returns:
+            The config instance.
+
+        Example:
+            ```python
+            config = HighlightParamsConfig.from_solr_dict({"hl": "true", "hl.fl": "title"})
+            ```
+        """
+        enable_key = cls.model_fields["enable_key"].default
+        aliases = cls._ALIAS_TO_NAME
+        values = {
+            aliases.get(key, key): value
+            for key, value in params.items()
+            if key != enable_key
+        }
+        if trusted:
+            return cast(Self, cls.model_construct(**values))
+        return cls.model_validate(values)
+
+    def to_solr_params(self) -> Dict[str, Any]:
+        """Return the explicitly set options keyed by Solr parameter name.
+
+        Equivalent to `model_dump(by_alias=True, exclude_none=True, exclude_unset=True)`.
+        Classes without serializers read the fields directly instead of walking
+        the serialization schema. The result is computed once per
+        instance, since a config is typically reused across many queries, and each
+        call returns a copy whose list and dict values are copied as well.
+
+        Returns:
+            Dictionary of Solr parameters.
+        """
+        return _copy_params(self._cached_solr_params())
+
+    def _cached_solr_params(self) -> Dict[str, Any]:
+        """The memoized to_solr_params() result itself; callers must not mutate it."""
+        serialized = self._serialized
+        if serialized is None:
+            serialized = self._serialized = self._build_solr_params()
+        return serialized
+
+    def _build_solr_params(self) -> Dict[str, Any]:
+        """Compute the to_solr_params() result."""
+        if self._MODEL_DUMP:
+            params = self.model_dump(
+                by_alias=True,
+                exclude_none=True,
+                exclude_unset=True,
+                exclude={"enable_key"},
+            )
+            for alias, value in params.items():
+                if isinstance(value, Enum):
+                    params[alias] = value.value
+            return params
+        values = self.__dict__
+        fields_set = self.__pydantic_fields_set__
+        enum_fields = self._ENUM_FIELDS
+        params = {}
+        for name, alias in self._EMIT:
+            if name not in fields_set:
+                continue
+            value = values[name]
+            if value is None:
+                continue
+            if name in enum_fields and isinstance(value, Enum):
+                value = value.value
+            params[alias] = value
+        return params
+
+    def to_json_fragment(self) -> bytes:
+        """Return the enable flag and Solr parameters as encoded JSON object members.
+
+        The members are not wrapped in braces, so fragments of several configs can
+        be joined with `b","` into one object. Encoded once per instance.
+
+        Returns:
+            UTF-8 JSON members, e.g. `b'"hl":true,"hl.fl":"title"'`.
+        """
+        fragment = self._json_fragment
+        if fragment is None:
+            params = {self.enable_key: True}
+            params.update(self._cached_solr_params())
+            fragment = self._json_fragment = _encode_json(params)[1:-1]
+        return fragment
+
+    def cacheable_key(self) -> bytes:
+        """Return a stable 16-byte digest of the emitted Solr parameters.
+
+        Configs that produce identical parameters share a key regardless of
+        argument order, so it can key caches placed in front of Solr.
+
+        Returns:
+            Digest of the enable key and the set parameters.
+
+        Example:
+            ```python
+            a = FacetParamsConfig(fields=["category"], mincount=1)
+            b = FacetParamsConfig(mincount=1, fields=["category"])
+            assert a.cacheable_key() == b.cacheable_key()
+            ```
+        """
+        payload = json.dumps(
+            [self.enable_key, self.to_solr_params()],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return blake2b(payload.encode(), digest_size=16).digest()
+
+
+def _copy_params(params: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a params dict along with its list and dict values.
+
+    Emitted values can be the config's own lists, which callers must not be able
+    to mutate through the result.
+    """
+    return {
+        key: value.copy() if isinstance(value, (list, dict)) else value
+        for key, value in params.items()
+    }
+
+
+def _encode_json(params: Mapping[str, Any]) -> bytes:
+    """Compact JSON encoding shared by the config and parser JSON builders."""
+    return json.dumps(params, separators=(",", ":"), default=str).encode()
+
+
+@cache
+def _load_descriptions(package: str, filename: str) -> Dict[str, str]:
+    """Load field descriptions, kept out of the classes to save resident memory."""
+    source = files(package).joinpath(filename).read_text("utf-8")
+    descriptions: Dict[str, str] = json.loads(source)
+    return descriptions
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> Optional[Pattern[str]]:
+    """Compile a regex parameter, or None if Python's re cannot parse it.
+
+    Solr evaluates these patterns as Java regexes, so syntax Python does not
+    support (e.g. \\p{L}) is left for Solr to judge rather than rejected here.
+    """
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
+def _as_tuple(value: Any) -> Any:
+    """Store a single string or a list of strings as a tuple."""
+    if isinstance(value, str):
+        return (value,)
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+# One or more strings, held as a tuple so validation has a single arm.
+_StrTuple = Annotated[Tuple[str, ...], BeforeValidator(_as_tuple)]
+
+
+def _str_tuple_param(
+    value: Optional[Union[str, Tuple[str, ...]]],
+    sep: Optional[str] = None,
+    unwrap: bool = False,
+) -> Optional[Union[str, List[str]]]:
+    """Emit a `_StrTuple` value in the shape its Solr parameter takes.
+
+    Joined with `sep` when given, otherwise a list; with `unwrap`, a single
+    value is sent as a plain string.
+    """
+    if value is None or isinstance(value, str):
+        # Strings only arrive unvalidated, through from_trusted()/from_solr_dict().
+        return value
+    if sep is not None:
+        return sep.join(value)
+    return value[0] if unwrap and len(value) == 1 else list(value)
+
+
+def _is_enum_annotation(annotation: Any) -> bool:
+    """Whether a field annotation is an Enum or Literal, possibly Optional."""
+    if get_origin(annotation) is Union:
+        return any(_is_enum_annotation(arg) for arg in get_args(annotation))
+    if get_origin(annotation) is Literal:
+        return True
+    return isinstance(annotation, type) and issubclass(annotation, Enum)
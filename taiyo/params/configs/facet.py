@@ -23,10 +23,15 @@ Example:
 """
 
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Pattern
 
-from pydantic import Field
-from taiyo.params.configs.base import ParamsConfig
+from pydantic import (
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+)
+from taiyo.params.configs.base import ParamsConfig, _compile_pattern
 
 
 class FacetMethod(str, Enum):
@@ -99,6 +104,29 @@ class RangeMethod(str, Enum):
     DV = "dv"
 
 
+class RangeSpec(NamedTuple):
+    """Start, end and gap of a range facet on a single field."""
+
+    start: str
+    end: str
+    gap: str
+
+
+def _as_range_spec(field: str, spec: Any) -> RangeSpec:
+    """Read a `range_specs` entry given as a RangeSpec, sequence or mapping."""
+    try:
+        if isinstance(spec, Mapping):
+            return RangeSpec(**spec)
+        if isinstance(spec, (list, tuple)):
+            return RangeSpec(*spec)
+    except TypeError as exc:
+        raise ValueError(f"Invalid range spec for {field!r}: {exc}") from exc
+    raise ValueError(
+        f"Range spec for {field!r} must be a RangeSpec, a (start, end, gap) "
+        f"sequence or a mapping, not {type(spec).__name__}"
+    )
+
+
 class FacetParamsConfig(ParamsConfig):
     """Solr Faceting Configuration - Categorize and Count Search Results.
 
@@ -129,6 +157,13 @@ class FacetParamsConfig(ParamsConfig):
         )
         ```
 
+        Range Faceting with RangeSpec:
+        ```python
+        config = FacetParamsConfig(
+            range_specs={'price': RangeSpec(start='0', end='1000', gap='100')}
+        )
+        ```
+
         Filtered Facets:
         ```python
         config = FacetParamsConfig(
@@ -144,6 +179,10 @@ class FacetParamsConfig(ParamsConfig):
         - Consider 'threads' for parallel faceting on large datasets
     """
 
+    __slots__ = ()
+
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
+
     enable_key: str = "facet"
 
     queries: Optional[List[str]] = Field(
@@ -152,7 +191,9 @@ class FacetParamsConfig(ParamsConfig):
         description="Arbitrary queries to generate facet counts for specific terms/expressions.",
     )
     fields: Optional[List[str]] = Field(
-        default=None, alias="facet.field", description="Fields to be treated as facets."
+        default=None,
+        alias="facet.field",
+        description="Fields to be treated as facets.",
     )
     prefix: Optional[str] = Field(
         default=None,
@@ -236,7 +277,9 @@ class FacetParamsConfig(ParamsConfig):
     )
 
     range_field: Optional[List[str]] = Field(
-        default=None, alias="facet.range", description="Fields for range faceting."
+        default=None,
+        alias="facet.range",
+        description="Fields for range faceting.",
     )
     range_start: Optional[Dict[str, str]] = Field(
         default=None,
@@ -284,3 +327,54 @@ class FacetParamsConfig(ParamsConfig):
         alias="facet.pivot.mincount",
         description="Minimum count for pivot facet inclusion.",
     )
+
+    @model_validator(mode="before")
+    @classmethod
+    def fuse_range_specs(cls, data: Any) -> Any:
+        """Expand `range_specs` into the per-field start/end/gap parameters.
+
+        Fields listed in `range_specs` are also added to `range_field` unless it
+        is given explicitly.
+        """
+        if not isinstance(data, dict) or "range_specs" not in data:
+            return data
+        data = dict(data)
+        specs: Optional[Dict[str, Any]] = data.pop("range_specs")
+        if not specs:
+            return data
+        starts = dict(data.get("range_start") or {})
+        ends = dict(data.get("range_end") or {})
+        gaps = dict(data.get("range_gap") or {})
+        for field, spec in specs.items():
+            start, end, gap = _as_range_spec(field, spec)
+            starts[field] = start
+            ends[field] = end
+            gaps[field] = gap
+        data["range_start"], data["range_end"], data["range_gap"] = starts, ends, gaps
+        data.setdefault("range_field", list(specs))
+        return data
+
+    @field_validator("matches")
+    @classmethod
+    def compile_matches(cls, value: Optional[str]) -> Optional[str]:
+        """Compile the pattern once so repeated configs reuse the cached form."""
+        if value:
+            _compile_pattern(value)
+        return value
+
+    @property
+    def matches_pattern(self) -> Optional[Pattern[str]]:
+        """The `matches` regex compiled with Python's re, if it can be."""
+        return _compile_pattern(self.matches) if self.matches else None
+
+    @property
+    def range_specs(self) -> Dict[str, RangeSpec]:
+        """Range settings for every field that has a start, end and gap."""
+        starts = self.range_start or {}
+        ends = self.range_end or {}
+        gaps = self.range_gap or {}
+        return {
+            field: RangeSpec(start, ends[field], gaps[field])
+            for field, start in starts.items()
+            if field in ends and field in gaps
+        }
@@ -11,10 +11,32 @@ Official Documentation:
 """
 
 from enum import Enum
-from typing import List, Optional, Union
-
-from pydantic import Field
-from taiyo.params.configs.base import ParamsConfig
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Pattern,
+    Tuple,
+    TypedDict,
+    Union,
+)
+
+from pydantic import (
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_serializer,
+)
+from taiyo.params.configs.base import (
+    ParamsConfig,
+    _StrTuple,
+    _compile_pattern,
+    _str_tuple_param,
+)
 
 
 class HighlightMethod(str, Enum):
@@ -82,6 +104,19 @@ class HighlightEncoder(str, Enum):
     HTML = "html"
 
 
+# Accepted values of the enum fields. Fields validate against these literals, so
+# plain strings and enum members both end up stored as plain strings.
+HighlightMethodValue = Literal["unified", "original", "fastVector"]
+BreakIteratorTypeValue = Literal[
+    "SEPARATOR", "SENTENCE", "WORD", "CHARACTER", "LINE", "WHOLE"
+]
+FragListBuilderValue = Literal["simple", "weighted", "single"]
+FragmentsBuilderValue = Literal["default", "colored"]
+FragmenterValue = Literal["gap", "regex"]
+FormatterValue = Literal["simple"]
+HighlightEncoderValue = Literal["", "html"]
+
+
 class HighlightParamsConfig(ParamsConfig):
     """Configuration for Solr Highlighting.
 
@@ -114,381 +149,245 @@ class HighlightParamsConfig(ParamsConfig):
           - 'fastVector': Fast for large documents (requires termVectors=true)
     """
 
-    enable_key: str = "hl"
+    __slots__ = ()
 
-    method: Optional[HighlightMethod] = Field(
-        default=None,
-        alias="hl.method",
-        description="""Highlighting implementation to use.
-        
-        - 'unified': Most accurate, recommended for most use cases (default)
-        - 'original': Legacy highlighter, works with any field type
-        - 'fastVector': Fastest for large documents (requires termVectors=true)
-        
-        Default: 'unified' (Solr 6.4+)""",
-    )
-    fields: Optional[Union[str, List[str]]] = Field(
-        default=None,
-        alias="hl.fl",
-        description="""Fields to generate highlighted snippets for.
-        
-        Example: ['title', 'content'] highlights both title and content fields.
-        Use '*' to highlight all fields (not recommended for performance).
-        
-        Fields must be stored (stored=true) to be highlighted.""",
-    )
-    query: Optional[str] = Field(
-        default=None,
-        alias="hl.q",
-        description="""Query to use for highlighting (overrides main query).
-        
-        Example: Highlight 'python programming' even if main query is broader.
-        
-        Default: Uses the main query (q parameter).""",
-    )
-    query_parser: Optional[str] = Field(
-        default=None,
-        alias="hl.qparser",
-        description="""Query parser to use for highlight_query.
-        
-        Example: 'edismax', 'lucene', 'dismax'
-        
-        Default: Uses the main query parser (defType parameter).""",
+    _DESCRIPTIONS_FILE = "highlight.schema.json"
+
+    model_config = ConfigDict(
+        revalidate_instances="never",
+        str_strip_whitespace=False,
+        defer_build=True,
     )
+
+    enable_key: str = "hl"
+
+    method: Optional[HighlightMethodValue] = Field(default=None, alias="hl.method")
+    fields: Optional[_StrTuple] = Field(default=None, alias="hl.fl")
+    query: Optional[str] = Field(default=None, alias="hl.q")
+    query_parser: Optional[str] = Field(default=None, alias="hl.qparser")
     require_field_match: Optional[bool] = Field(
-        default=None,
-        alias="hl.requireFieldMatch",
-        description="""If true, only highlight terms in the field they matched.
-        
-        Example: With query 'title:python', only highlights 'python' in title field,
-        not in other fields.
-        
-        Set to false to highlight query terms in all requested fields.
-        Default: false""",
+        default=None, alias="hl.requireFieldMatch"
     )
     query_field_pattern: Optional[str] = Field(
-        default=None,
-        alias="hl.queryFieldPattern",
-        description="""Regular expression pattern for fields to consider for highlighting.
-        
-        Example: '.*_text$' matches all fields ending with '_text'.
-        
-        Works with require_field_match to control highlighting scope.""",
+        default=None, alias="hl.queryFieldPattern"
     )
     use_phrase_highlighter: Optional[bool] = Field(
-        default=None,
-        alias="hl.usePhraseHighlighter",
-        description="""If true, highlights complete phrases accurately.
-        
-        Example: Query 'machine learning' only highlights when both words appear
-        together, not 'machine' or 'learning' separately.
-        
-        Default: true (recommended)""",
-    )
-    multiterm: Optional[bool] = Field(
-        default=None,
-        alias="hl.highlightMultiTerm",
-        description="""Enable highlighting for wildcard, fuzzy, and range queries.
-        
-        Example: Query 'progr*' highlights 'programming', 'program', 'progress'.
-        
-        Can impact performance for complex multi-term queries.
-        Default: true""",
-    )
-    snippets_per_field: Optional[int] = Field(
-        default=None,
-        alias="hl.snippets",
-        description="""Maximum number of snippets to return per field.
-        
-        Example: Set to 3 to show up to 3 relevant passages from each field.
-        Higher values help users see more context but increase response size.
-        
-        Default: 1""",
-    )
-    fragment_size: Optional[int] = Field(
-        default=None,
-        alias="hl.fragsize",
-        description="""Size of highlighted snippets in characters.
-        
-        Example: 150 creates ~150 character snippets around matched terms.
-        Set to 0 to highlight the entire field content (not recommended for large fields).
-        
-        Default: 100""",
-    )
-    encoder: Optional[HighlightEncoder] = Field(
-        default=None,
-        alias="hl.encoder",
-        description="""Text encoder for highlighted snippets.
-        
-        - 'html': Escape HTML special characters (<, >, &, etc.) - recommended for web display
-        - '' (empty): No encoding
-        
-        Use 'html' to prevent XSS vulnerabilities when displaying highlights.""",
-    )
-    max_analyzed_chars: Optional[int] = Field(
-        default=None,
-        alias="hl.maxAnalyzedChars",
-        description="""Maximum characters to analyze for highlighting per field.
-        
-        For large documents, only analyzes the first N characters to improve performance.
-        Matches beyond this limit won't be highlighted.
-        
-        Example: 51200 (50KB) is a good balance for most use cases.
-        Default: 51200""",
-    )
-    tag_before: Optional[str] = Field(
-        default=None,
-        alias="hl.tag.pre",
-        description="""Text/tag to insert before each highlighted term.
-        
-        Example: '<mark class="highlight">' or '<strong>' or '**'
-        
-        Default: '<em>'""",
-    )
-    tag_after: Optional[str] = Field(
-        default=None,
-        alias="hl.tag.post",
-        description="""Text/tag to insert after each highlighted term.
-        
-        Example: '</mark>' or '</strong>' or '**'
-        
-        Default: '</em>'""",
+        default=None, alias="hl.usePhraseHighlighter"
     )
+    multiterm: Optional[bool] = Field(default=None, alias="hl.highlightMultiTerm")
+    snippets_per_field: Optional[int] = Field(default=None, alias="hl.snippets")
+    fragment_size: Optional[int] = Field(default=None, alias="hl.fragsize")
+    encoder: Optional[HighlightEncoderValue] = Field(default=None, alias="hl.encoder")
+    max_analyzed_chars: Optional[int] = Field(default=None, alias="hl.maxAnalyzedChars")
+    tag_before: Optional[str] = Field(default=None, alias="hl.tag.pre")
+    tag_after: Optional[str] = Field(default=None, alias="hl.tag.post")
 
     # Unified Highlighter specific parameters (most accurate, recommended)
     # Reference: https://solr.apache.org/guide/solr/latest/query-guide/highlighting.html#unified-highlighter
 
-    offset_source: Optional[str] = Field(
-        default=None,
-        alias="hl.offsetSource",
-        description="""How offsets are obtained (Unified Highlighter only).
-        
-        Options:
-        - ANALYSIS: Analyze text on-the-fly (slower, smaller index)
-        - POSTINGS: Use postings (fast, requires storeOffsetsWithPositions=true)
-        - POSTINGS_WITH_TERM_VECTORS: Use postings with term vectors
-        - TERM_VECTORS: Use term vectors (requires termVectors=true)
-        
-        Usually auto-detected. Set explicitly during index format migrations.""",
-    )
-    frag_align_ratio: Optional[float] = Field(
-        default=None,
-        alias="hl.fragAlignRatio",
-        description="""Where to position the first match in the snippet (0.0-1.0).
-        
-        - 0.0: Align match to start (left)
-        - 0.33: Align to left third (default, shows context before match)
-        - 0.5: Center the match
-        - 1.0: Align match to end (right)
-        
-        Lower values improve performance when highlighting lots of text.
-        Default: 0.33""",
-    )
+    offset_source: Optional[str] = Field(default=None, alias="hl.offsetSource")
+    frag_align_ratio: Optional[float] = Field(default=None, alias="hl.fragAlignRatio")
     fragsize_is_minimum: Optional[bool] = Field(
-        default=None,
-        alias="hl.fragsizeIsMinimum",
-        description="""How to interpret fragment_size.
-        
-        - true: Treat as minimum size (fragments at least this big)
-        - false: Treat as target size (average fragment size)
-        
-        False is slower but gives more consistent snippet lengths.
-        Default: true""",
-    )
-    tag_ellipsis: Optional[str] = Field(
-        default=None,
-        alias="hl.tag.ellipsis",
-        description="""Text to display between multiple snippets.
-        
-        Example: '...' or ' [...] '
-        
-        By default, each snippet is returned separately.""",
-    )
-    default_summary: Optional[bool] = Field(
-        default=None,
-        alias="hl.defaultSummary",
-        description="""If true, return leading text when no matches found.
-        
-        Useful to always show a preview even if search terms don't match.
-        Default: false""",
-    )
-    score_k1: Optional[float] = Field(
-        default=None,
-        alias="hl.score.k1",
-        description="""BM25 term frequency normalization parameter.
-        
-        Controls how term frequency affects passage scoring.
-        Set to 0 to ignore term frequency (only count distinct terms).
-        Default: 1.2""",
-    )
-    score_b: Optional[float] = Field(
-        default=None,
-        alias="hl.score.b",
-        description="""BM25 length normalization parameter.
-        
-        Controls how passage length affects scoring.
-        Set to 0 to ignore passage length completely.
-        Default: 0.75""",
-    )
-    score_pivot: Optional[int] = Field(
-        default=None,
-        alias="hl.score.pivot",
-        description="""BM25 average passage length in characters.
-        
-        Passages longer than this are penalized, shorter are boosted.
-        Default: 87""",
-    )
-    bs_language: Optional[str] = Field(
-        default=None,
-        alias="hl.bs.language",
-        description="""BreakIterator language for text segmentation.
-        
-        Example: 'en' for English, 'ja' for Japanese, 'de' for German.
-        Used to intelligently break text at sentence/word boundaries.""",
-    )
-    bs_country: Optional[str] = Field(
-        default=None,
-        alias="hl.bs.country",
-        description="""BreakIterator country code.
-        
-        Example: 'US', 'GB', 'JP'
-        Used with bs_language for locale-specific text breaking.""",
-    )
-    bs_variant: Optional[str] = Field(
-        default=None,
-        alias="hl.bs.variant",
-        description="BreakIterator variant for specialized locale rules.",
-    )
-    bs_type: Optional[BreakIteratorType] = Field(
-        default=None,
-        alias="hl.bs.type",
-        description="""How to segment text into passages.
-        
-        - SENTENCE: Break on sentence boundaries (default, recommended)
-        - WORD: Break on word boundaries
-        - CHARACTER: Break on any character
-        - LINE: Break on line breaks
-        - SEPARATOR: Break on custom separator (use bs_separator)
-        - WHOLE: Use entire field as one passage
-        
-        Default: SENTENCE""",
-    )
-    bs_separator: Optional[str] = Field(
-        default=None,
-        alias="hl.bs.separator",
-        description="""Custom separator character when bs_type=SEPARATOR.
-        
-        Example: '\n' to break on newlines, '|' for pipe-separated text.""",
-    )
-    weight_matches: Optional[bool] = Field(
-        default=None,
-        alias="hl.weightMatches",
-        description="""Use Lucene's Weight Matches API for most accurate highlighting.
-        
-        - Reflects query structure exactly
-        - Highlights phrases as a whole
-        - Currently slower for many fields
-        
-        Automatically disabled if usePhraseHighlighter=false or highlightMultiTerm=false.
-        Default: varies""",
-    )
+        default=None, alias="hl.fragsizeIsMinimum"
+    )
+    tag_ellipsis: Optional[str] = Field(default=None, alias="hl.tag.ellipsis")
+    default_summary: Optional[bool] = Field(default=None, alias="hl.defaultSummary")
+    score_k1: Optional[float] = Field(default=None, alias="hl.score.k1")
+    score_b: Optional[float] = Field(default=None, alias="hl.score.b")
+    score_pivot: Optional[int] = Field(default=None, alias="hl.score.pivot")
+    bs_language: Optional[str] = Field(default=None, alias="hl.bs.language")
+    bs_country: Optional[str] = Field(default=None, alias="hl.bs.country")
+    bs_variant: Optional[str] = Field(default=None, alias="hl.bs.variant")
+    bs_type: Optional[BreakIteratorTypeValue] = Field(default=None, alias="hl.bs.type")
+    bs_separator: Optional[str] = Field(default=None, alias="hl.bs.separator")
+    weight_matches: Optional[bool] = Field(default=None, alias="hl.weightMatches")
 
     # Original Highlighter specific
-    merge_contiguous: Optional[bool] = Field(
-        default=None,
-        alias="hl.mergeContiguous",
-        description="Merge contiguous fragments.",
-    )
+    merge_contiguous: Optional[bool] = Field(default=None, alias="hl.mergeContiguous")
     max_multivalued_to_examine: Optional[int] = Field(
-        default=None,
-        alias="hl.maxMultiValuedToExamine",
-        description="Max entries to examine in multivalued field.",
+        default=None, alias="hl.maxMultiValuedToExamine"
     )
     max_multivalued_to_match: Optional[int] = Field(
-        default=None,
-        alias="hl.maxMultiValuedToMatch",
-        description="Max matches in multivalued field.",
+        default=None, alias="hl.maxMultiValuedToMatch"
     )
     alternate_field: Optional[str] = Field(
-        default=None, alias="hl.alternateField", description="Backup field for summary."
-    )
-    max_alternate_field_length: Optional[int] = Field(
-        default=None,
-        alias="hl.maxAlternateFieldLength",
-        description="Max length of alternate field.",
-    )
-    alternate: Optional[bool] = Field(
-        default=None,
-        alias="hl.highlightAlternate",
-        description="Highlight alternate field.",
-    )
-    formatter: Optional[Formatter] = Field(
-        default=None,
-        alias="hl.formatter",
-        description="Formatter for highlighted output.",
-    )
-    simple_pre: Optional[str] = Field(
         default=None,
-        alias="hl.simple.pre",
-        description="Text before term (simple formatter).",
+        alias="hl.alternateField",
     )
-    simple_post: Optional[str] = Field(
-        default=None,
-        alias="hl.simple.post",
-        description="Text after term (simple formatter).",
-    )
-    fragmenter: Optional[Fragmenter] = Field(
-        default=None, alias="hl.fragmenter", description="Text snippet generator type."
-    )
-    regex_slop: Optional[float] = Field(
-        default=None,
-        alias="hl.regex.slop",
-        description="Deviation factor for regex fragmenter.",
+    max_alternate_field_length: Optional[int] = Field(
+        default=None, alias="hl.maxAlternateFieldLength"
     )
-    regex_pattern: Optional[str] = Field(
+    alternate: Optional[bool] = Field(default=None, alias="hl.highlightAlternate")
+    formatter: Optional[FormatterValue] = Field(default=None, alias="hl.formatter")
+    simple_pre: Optional[str] = Field(default=None, alias="hl.simple.pre")
+    simple_post: Optional[str] = Field(default=None, alias="hl.simple.post")
+    fragmenter: Optional[FragmenterValue] = Field(
         default=None,
-        alias="hl.regex.pattern",
-        description="Pattern for regex fragmenter.",
+        alias="hl.fragmenter",
     )
+    regex_slop: Optional[float] = Field(default=None, alias="hl.regex.slop")
+    regex_pattern: Optional[str] = Field(default=None, alias="hl.regex.pattern")
     regex_max_analyzed_chars: Optional[int] = Field(
-        default=None,
-        alias="hl.regex.maxAnalyzedChars",
-        description="Char limit for regex fragmenter.",
-    )
-    preserve_multi: Optional[bool] = Field(
-        default=None,
-        alias="hl.preserveMulti",
-        description="Preserve order in multivalued fields.",
-    )
-    payloads: Optional[bool] = Field(
-        default=None,
-        alias="hl.payloads",
-        description="Include payloads in highlighting.",
+        default=None, alias="hl.regex.maxAnalyzedChars"
     )
+    preserve_multi: Optional[bool] = Field(default=None, alias="hl.preserveMulti")
+    payloads: Optional[bool] = Field(default=None, alias="hl.payloads")
 
     # FastVector Highlighter specific
-    frag_list_builder: Optional[FragListBuilder] = Field(
-        default=None,
-        alias="hl.fragListBuilder",
-        description="Snippet fragmenting algorithm.",
+    frag_list_builder: Optional[FragListBuilderValue] = Field(
+        default=None, alias="hl.fragListBuilder"
     )
-    fragments_builder: Optional[FragmentsBuilder] = Field(
-        default=None,
-        alias="hl.fragmentsBuilder",
-        description="Fragment formatting implementation.",
-    )
-    boundary_scanner: Optional[str] = Field(
-        default=None,
-        alias="hl.boundaryScanner",
-        description="Boundary scanner implementation.",
-    )
-    phrase_limit: Optional[int] = Field(
-        default=None,
-        alias="hl.phraseLimit",
-        description="Max phrases to analyze for scoring.",
+    fragments_builder: Optional[FragmentsBuilderValue] = Field(
+        default=None, alias="hl.fragmentsBuilder"
     )
+    boundary_scanner: Optional[str] = Field(default=None, alias="hl.boundaryScanner")
+    phrase_limit: Optional[int] = Field(default=None, alias="hl.phraseLimit")
     multivalue_separator: Optional[str] = Field(
-        default=None,
-        alias="hl.multiValuedSeparatorChar",
-        description="Separator for multivalued fields.",
-    )
+        default=None, alias="hl.multiValuedSeparatorChar"
+    )
+
+    @field_serializer("fields")
+    def serialize_fields(
+        self, value: Optional[Tuple[str, ...]]
+    ) -> Optional[Union[str, List[str]]]:
+        return _str_tuple_param(value, sep=",")
+
+    @property
+    def query_field_pattern_re(self) -> Optional[Pattern[str]]:
+        """`query_field_pattern` compiled with Python's re, if it can be."""
+        pattern = self.query_field_pattern
+        return _compile_pattern(pattern) if pattern else None
+
+    @property
+    def regex_pattern_re(self) -> Optional[Pattern[str]]:
+        """`regex_pattern` compiled with Python's re, if it can be."""
+        return _compile_pattern(self.regex_pattern) if self.regex_pattern else None
+
+    def to_params_dict(self) -> "HighlightParamsDict":
+        """Return the set options as a plain dict keyed by field name.
+
+        The inverse of `from_trusted()`, for handing a validated config to code
+        that works on `HighlightParamsDict`, e.g. `highlight_params_to_solr()`.
+
+        Returns:
+            Options that were set and are not None.
+        """
+        values = self.__dict__
+        params: Dict[str, Any] = {}
+        for name in self.__pydantic_fields_set__:
+            value = values[name]
+            if value is not None and name != "enable_key":
+                params[name] = list(value) if name == "fields" else value
+        return params  # type: ignore[return-value]
+
+
+# Field name to Solr parameter name, built once from the model.
+_ALIAS_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        name: field.alias or name
+        for name, field in HighlightParamsConfig.model_fields.items()
+        if name != "enable_key"
+    }
+)
+
+
+class HighlightParamsDict(TypedDict, total=False):
+    """Highlight options as a plain dict, keyed by HighlightParamsConfig field name.
+
+    For trusted, serialize-only call sites that do not need a model instance; see
+    `highlight_params_to_solr()`.
+    """
+
+    method: HighlightMethodValue
+    fields: Union[str, List[str]]
+    query: str
+    query_parser: str
+    require_field_match: bool
+    query_field_pattern: str
+    use_phrase_highlighter: bool
+    multiterm: bool
+    snippets_per_field: int
+    fragment_size: int
+    encoder: HighlightEncoderValue
+    max_analyzed_chars: int
+    tag_before: str
+    tag_after: str
+    offset_source: str
+    frag_align_ratio: float
+    fragsize_is_minimum: bool
+    tag_ellipsis: str
+    default_summary: bool
+    score_k1: float
+    score_b: float
+    score_pivot: int
+    bs_language: str
+    bs_country: str
+    bs_variant: str
+    bs_type: BreakIteratorTypeValue
+    bs_separator: str
+    weight_matches: bool
+    merge_contiguous: bool
+    max_multivalued_to_examine: int
+    max_multivalued_to_match: int
+    alternate_field: str
+    max_alternate_field_length: int
+    alternate: bool
+    formatter: FormatterValue
+    simple_pre: str
+    simple_post: str
+    fragmenter: FragmenterValue
+    regex_slop: float
+    regex_pattern: str
+    regex_max_analyzed_chars: int
+    preserve_multi: bool
+    payloads: bool
+    frag_list_builder: FragListBuilderValue
+    fragments_builder: FragmentsBuilderValue
+    boundary_scanner: str
+    phrase_limit: int
+    multivalue_separator: str
+
+
+def highlight_params_to_solr(params: HighlightParamsDict) -> Dict[str, Any]:
+    """Convert a highlight options dict to Solr request parameters.
+
+    Skips model construction entirely. Values are not validated, `None` values are
+    dropped and a list of fields is sent as a comma-separated `hl.fl`.
+
+    Args:
+        params: Highlight options keyed by field name.
+
+    Returns:
+        Solr parameters, including `hl=true`.
+
+    Example:
+        ```python
+        highlight_params_to_solr({"fields": ["title", "body"], "snippets_per_field": 2})
+        # {"hl": True, "hl.fl": "title,body", "hl.snippets": 2}
+        ```
+    """
+    solr_params: Dict[str, Any] = {"hl": True}
+    for name, value in params.items():
+        if value is None:
+            continue
+        solr_params[_ALIAS_MAP[name]] = (
+            ",".join(value) if isinstance(value, (list, tuple)) else value
+        )
+    return solr_params
+
+
+HIGHLIGHT_ADAPTER: TypeAdapter[HighlightParamsConfig]
+
+
+def __getattr__(name: str) -> Any:
+    """Build HIGHLIGHT_ADAPTER on first access.
+
+    HIGHLIGHT_ADAPTER is a shared TypeAdapter for highlight configs given as plain
+    dicts or JSON, e.g. `HIGHLIGHT_ADAPTER.validate_json(raw)`. Creating it
+    compiles the model schema, so importing this module does not.
+    """
+    if name == "HIGHLIGHT_ADAPTER":
+        adapter = TypeAdapter(HighlightParamsConfig)
+        globals()[name] = adapter
+        return adapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
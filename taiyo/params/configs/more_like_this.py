@@ -1,7 +1,7 @@
-from pydantic import Field
-from typing import Optional, Union
+from pydantic import ConfigDict, Field, field_serializer
+from typing import List, Optional, Tuple, Union
 
-from taiyo.params.configs.base import ParamsConfig
+from taiyo.params.configs.base import ParamsConfig, _StrTuple, _str_tuple_param
 
 
 class MoreLikeThisParamsConfig(ParamsConfig):
@@ -45,9 +45,13 @@ class MoreLikeThisParamsConfig(ParamsConfig):
         - Set max_num_tokens_parsed to limit analysis on large documents
     """
 
+    __slots__ = ()
+
+    model_config = ConfigDict(defer_build=True)
+
     enable_key: str = "mlt"
 
-    fields: Optional[Union[str, list[str]]] = Field(
+    fields: Optional[_StrTuple] = Field(
         default=None,
         alias="mlt.fl",
         description="Fields to analyze for similarity. Use fields with meaningful content (title, description, body). For best performance, enable term vectors on these fields.",
@@ -117,3 +121,9 @@ class MoreLikeThisParamsConfig(ParamsConfig):
         alias="mlt.match.offset",
         description="When using with a query, specifies which result doc to use for similarity (0 = first result, 1 = second, etc.). Default: 0.",
     )
+
+    @field_serializer("fields")
+    def serialize_fields(
+        self, value: Optional[Union[str, Tuple[str, ...]]]
+    ) -> Optional[Union[str, List[str]]]:
+        return _str_tuple_param(value)
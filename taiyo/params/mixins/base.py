@@ -2,4 +2,7 @@ from pydantic import BaseModel, ConfigDict
 
 
 class ParamsMixin(BaseModel):
+    # Field values live in __dict__; subclasses declaring empty slots skip __weakref__.
+    __slots__ = ()
+
     model_config = ConfigDict(validate_by_name=True)
@@ -9,6 +9,8 @@ class CommonParamsMixin(ParamsMixin):
     https://solr.apache.org/guide/solr/latest/query-guide/common-query-parameters.html
     """
 
+    __slots__ = ()
+
     sort: Optional[str] = Field(
         default="score desc",
         description="Sort order for results (e.g., 'score desc', 'price asc'). Default: score desc.",
@@ -1,9 +1,15 @@
+import re
+import sys
+from operator import attrgetter
+from itertools import chain
 from pydantic import Field, computed_field
-from typing import Optional, List
+from typing import Any, ClassVar, Iterator, Optional, List, Tuple
 from taiyo.params.mixins.base import ParamsMixin
 
 
 class DenseVectorSearchParamsMixin(ParamsMixin):
+    __slots__ = ()
+
     field: str = Field(
         ..., alias="f", description="DenseVectorField to search in. Required."
     )
@@ -23,25 +29,62 @@ class DenseVectorSearchParamsMixin(ParamsMixin):
         description="fq filters with these tags are excluded from implicit pre-filtering.",
     )
 
+    # (alias, field name) pairs read by vector_search_params, set below the class.
+    _FIELD_ALIASES: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+    # Reads the _FIELD_ALIASES fields in one call, set below the class.
+    _ATTR_GETTER: ClassVar["attrgetter[Tuple[Any, ...]]"]
+    # Computed and regular field names of the mixin, set below the class.
+    _MIXIN_KEYS: ClassVar[Tuple[str, ...]] = ()
+
+    # Joined on every access: the list fields can be changed in place, which a
+    # cached string would not follow.
     @computed_field
     def vector_search_params(self) -> str:
-        params = self.model_dump(
-            include=set(DenseVectorSearchParamsMixin.__annotations__.keys()),
-            by_alias=True,
-            exclude_computed_fields=True,
-            exclude_none=True,
+        return " ".join(
+            chain.from_iterable(
+                _format_params(alias, value)
+                for (alias, _), value in zip(
+                    self._FIELD_ALIASES, self._ATTR_GETTER(self), strict=True
+                )
+            )
         )
-        res = []
-        for k, v in params.items():
-            if isinstance(v, list):
-                for vi in v:
-                    res.append(f"{k}={vi}")
-            else:
-                res.append(f"{k}={v}")
-        return " ".join(res)
 
     @classmethod
-    def get_mixin_keys(cls) -> List[str]:
-        return list(DenseVectorSearchParamsMixin.model_computed_fields.keys()) + list(
-            DenseVectorSearchParamsMixin.__annotations__.keys()
-        )
+    def get_mixin_keys(cls) -> Tuple[str, ...]:
+        return DenseVectorSearchParamsMixin._MIXIN_KEYS
+
+
+# Characters that end or break an unquoted local param value.
+_NEEDS_QUOTING = re.compile(r"[\s'\"{}\\]")
+# Characters escaped inside a single-quoted local param value.
+_QUOTED_ESCAPES = re.compile(r"['\\]")
+
+
+def _local_param_value(value: Any) -> str:
+    """Render a local param value, single-quoting it when it would break parsing."""
+    text = str(value)
+    if _NEEDS_QUOTING.search(text) is None:
+        return text
+    return "'" + _QUOTED_ESCAPES.sub(r"\\\g<0>", text) + "'"
+
+
+def _format_params(alias: str, value: Any) -> Iterator[str]:
+    """Yield alias=value, once per item for lists and not at all for None."""
+    if value is None:
+        return
+    if isinstance(value, list):
+        yield from (f"{alias}={_local_param_value(v)}" for v in value)
+    else:
+        yield f"{alias}={_local_param_value(value)}"
+
+
+DenseVectorSearchParamsMixin._FIELD_ALIASES = tuple(
+    (sys.intern(field.alias or name), name)
+    for name, field in DenseVectorSearchParamsMixin.model_fields.items()
+)
+DenseVectorSearchParamsMixin._ATTR_GETTER = attrgetter(
+    *(name for _, name in DenseVectorSearchParamsMixin._FIELD_ALIASES)
+)
+DenseVectorSearchParamsMixin._MIXIN_KEYS = tuple(
+    DenseVectorSearchParamsMixin.model_computed_fields
+) + tuple(DenseVectorSearchParamsMixin.model_fields)
@@ -1,4 +1,6 @@
-from typing import List, Optional, Literal
+import sys
+from operator import attrgetter
+from typing import Any, ClassVar, FrozenSet, Optional, Literal, Tuple
 from pydantic import Field, field_serializer, computed_field
 from taiyo.params.mixins.base import ParamsMixin
 
@@ -6,6 +8,8 @@ from taiyo.params.mixins.base import ParamsMixin
 class SpatialSearchParamsMixin(ParamsMixin):
     """Base mixin for spatial search parameters used by geofilt and bbox parsers."""
 
+    __slots__ = ()
+
     spatial_field: str = Field(
         ...,
         alias="sfield",
@@ -42,31 +46,55 @@ class SpatialSearchParamsMixin(ParamsMixin):
         description="Whether to cache the filter query (default: true)",
     )
 
+    # (alias, field name) pairs read by spatial_params, set below the class.
+    # sfield is left out, the parser writes it itself.
+    _FIELD_ALIASES: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+    # Reads the _FIELD_ALIASES fields in one call, set below the class.
+    _ATTR_GETTER: ClassVar["attrgetter[Tuple[Any, ...]]"]
+    # Aliases of the boolean fields, sent as true/false; set below the class.
+    _BOOL_ALIASES: ClassVar[FrozenSet[str]] = frozenset()
+    # Computed and regular field names of the mixin, set below the class.
+    _MIXIN_KEYS: ClassVar[Tuple[str, ...]] = ()
+
     @field_serializer("center_point", return_type=str)
     def serialize_point(self, values: list[float]) -> str:
-        return ",".join([str(v) for v in values])
+        return ",".join(map(str, values))
 
     @computed_field
     def spatial_params(self) -> str:
         """Build the spatial search parameters string for use in filter queries."""
-        params = self.model_dump(
-            include=set(SpatialSearchParamsMixin.__annotations__.keys()),
-            by_alias=True,
-            exclude_computed_fields=True,
-            exclude_none=True,
+        values = zip(self._FIELD_ALIASES, self._ATTR_GETTER(self), strict=True)
+        return " ".join(
+            _format_param(alias, self.serialize_point(v) if alias == "pt" else v)
+            for (alias, _), v in values
+            if v is not None
         )
-        _ = params.pop("sfield", None)
-
-        res = []
-        for k, v in params.items():
-            if isinstance(v, bool):
-                res.append(f"{k}={str(v).lower()}")
-            else:
-                res.append(f"{k}={v}")
-        return " ".join(res)
 
     @classmethod
-    def get_mixin_keys(cls) -> List[str]:
-        return list(SpatialSearchParamsMixin.model_computed_fields.keys()) + list(
-            SpatialSearchParamsMixin.__annotations__.keys()
-        )
+    def get_mixin_keys(cls) -> Tuple[str, ...]:
+        return SpatialSearchParamsMixin._MIXIN_KEYS
+
+
+def _format_param(alias: str, value: Any) -> str:
+    """Format a local param, with Solr-style booleans."""
+    if alias in SpatialSearchParamsMixin._BOOL_ALIASES:
+        return f"{alias}={'true' if value else 'false'}"
+    return f"{alias}={value}"
+
+
+SpatialSearchParamsMixin._FIELD_ALIASES = tuple(
+    (sys.intern(field.alias or name), name)
+    for name, field in SpatialSearchParamsMixin.model_fields.items()
+    if name != "spatial_field"
+)
+SpatialSearchParamsMixin._ATTR_GETTER = attrgetter(
+    *(name for _, name in SpatialSearchParamsMixin._FIELD_ALIASES)
+)
+SpatialSearchParamsMixin._MIXIN_KEYS = tuple(
+    SpatialSearchParamsMixin.model_computed_fields
+) + tuple(SpatialSearchParamsMixin.model_fields)
+SpatialSearchParamsMixin._BOOL_ALIASES = frozenset(
+    field.alias or name
+    for name, field in SpatialSearchParamsMixin.model_fields.items()
+    if field.annotation in (bool, Optional[bool])
+)
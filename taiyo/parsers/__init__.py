@@ -1,13 +1,18 @@
-from .sparse import StandardParser, DisMaxQueryParser, ExtendedDisMaxQueryParser
-from .dense import (
-    KNNQueryParser,
-    KNNTextToVectorQueryParser,
-    VectorSimilarityQueryParser,
-)
-from .spatial import GeoFilterQueryParser
-from .terms import TermsQueryParser
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseQueryParser
 
+if TYPE_CHECKING:
+    from .sparse import StandardParser, DisMaxQueryParser, ExtendedDisMaxQueryParser
+    from .dense import (
+        KNNQueryParser,
+        KNNTextToVectorQueryParser,
+        VectorSimilarityQueryParser,
+    )
+    from .spatial import BBoxQueryParser, GeoFilterQueryParser
+    from .terms import TermsQueryParser
+
 __all__ = [
     "BaseQueryParser",
     "StandardParser",
@@ -16,6 +21,30 @@ __all__ = [
     "KNNQueryParser",
     "KNNTextToVectorQueryParser",
     "VectorSimilarityQueryParser",
+    "BBoxQueryParser",
     "GeoFilterQueryParser",
     "TermsQueryParser",
 ]
+
+# Parser name to the subpackage defining it, imported on first access.
+_LAZY_PARSERS = {
+    "StandardParser": ".sparse",
+    "DisMaxQueryParser": ".sparse",
+    "ExtendedDisMaxQueryParser": ".sparse",
+    "KNNQueryParser": ".dense",
+    "KNNTextToVectorQueryParser": ".dense",
+    "VectorSimilarityQueryParser": ".dense",
+    "BBoxQueryParser": ".spatial",
+    "GeoFilterQueryParser": ".spatial",
+    "TermsQueryParser": ".terms",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import parser subpackages on first access."""
+    module = _LAZY_PARSERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    parser = getattr(import_module(module, __name__), name)
+    globals()[name] = parser
+    return parser
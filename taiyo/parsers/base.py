@@ -1,6 +1,22 @@
-from typing import Any, Dict, List, Literal, Optional, Self, Union
-from pydantic import ConfigDict
-from taiyo.params.configs.base import ParamsConfig
+import inspect
+import sys
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Self,
+    Tuple,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
+from pydantic import ConfigDict, Field
+from taiyo.params.configs.base import ParamsConfig, _encode_json
 from taiyo.params.configs.facet import (
     FacetParamsConfig,
 )
@@ -8,39 +24,138 @@ from taiyo.params.configs.group import GroupParamsConfig
 from taiyo.params.configs.highlight import (
     HighlightParamsConfig,
 )
-from taiyo.params.configs.more_like_this import MoreLikeThisParamsConfig
 from taiyo.params.mixins.common import CommonParamsMixin
 
 
 class BaseQueryParser(CommonParamsMixin):
+    __slots__ = ()
+
     model_config = ConfigDict(validate_by_alias=False, extra="forbid")
 
-    configs: list[ParamsConfig] = []
+    configs: list[ParamsConfig] = Field(default_factory=list, exclude=True)
+
+    # Fields and computed fields left out of build(), besides Field(exclude=True).
+    _BUILD_EXCLUDE: ClassVar[FrozenSet[str]] = frozenset()
+    # (field name, alias, field serializer method or None) for _fast_dump().
+    _DUMP_FIELDS: ClassVar[Tuple[Tuple[str, str, Optional[str]], ...]] = ()
+    # (computed field name, alias, constant value or None) for _fast_dump().
+    # Computed fields returning a single Literal are emitted without a call.
+    _DUMP_COMPUTED: ClassVar[Tuple[Tuple[str, str, Any], ...]] = ()
+    # Whether _fast_dump() matches model_dump() for this class, see
+    # _fast_dump_supported().
+    _FAST_DUMP: ClassVar[bool] = True
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        _compile_dump_tables(cls)
+
+    @classmethod
+    def from_trusted(cls, **kwargs: Any) -> Self:
+        """Build a parser from already-typed values without running validation.
+
+        For parsers assembled by internal code from validated inputs; user-facing
+        code should use the validating constructor. Values are stored as given, so
+        callers must pass Python field names and correctly typed values.
+
+        Args:
+            **kwargs: Field values keyed by field name.
+
+        Returns:
+            The parser instance.
+
+        Example:
+            ```python
+            parser = StandardParser.from_trusted(query="title:solr", rows=5)
+            ```
+        """
+        return cast(Self, cls.model_construct(**kwargs))
 
     def serialize_configs(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Serialize ParamsConfig objects as top level params."""
-        updates: Dict[str, Any] = {}
         for config in self.configs:
-            updates[config.enable_key] = True
-            updates.update(
-                config.model_dump(exclude_none=True, exclude_unset=True, by_alias=True)
-            )
-        params.update(updates)
+            params[config.enable_key] = True
+            params.update(config.to_solr_params())
+        return params
+
+    def build(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Serialize the parser configuration to Solr-compatible query parameters.
+
+        Without extra arguments the set fields are read directly (see `_fast_dump`)
+        when that matches model_dump for the class; otherwise, or when keyword
+        arguments are given, they are passed on to Pydantic's model_dump.
+        """
+        return self.serialize_configs(self._dump_params(**kwargs))
+
+    def build_json(self) -> bytes:
+        """
+        Serialize the parser configuration as an encoded JSON object of Solr parameters.
+
+        Holds the same parameters as `build()`, e.g. for the `params` block of Solr's
+        JSON Request API. Each config contributes its cached `to_json_fragment()`, so
+        reused configs are not encoded again.
+        """
+        configs = self.configs
+        if len({config.enable_key for config in configs}) != len(configs):
+            # Repeated configs override each other's keys, which only a dict merge does.
+            return _encode_json(self.build())
+        parts = [_encode_json(self._dump_params())[1:-1]]
+        parts.extend(config.to_json_fragment() for config in configs)
+        return b"{" + b",".join(part for part in parts if part) + b"}"
+
+    def _dump_params(self, **kwargs: Any) -> Dict[str, Any]:
+        """Dump the parser's own fields, without configs, for `build()`."""
+        if kwargs or not self._FAST_DUMP:
+            kwargs.setdefault("by_alias", True)
+            kwargs.setdefault("exclude_none", True)
+            kwargs.setdefault("exclude", set(self._BUILD_EXCLUDE))
+            kwargs.setdefault("exclude_unset", True)
+            return self.model_dump(**kwargs)
+        return self._fast_dump()
+
+    def _fast_dump(self) -> Dict[str, Any]:
+        """Dump set fields and computed fields by alias without pydantic-core.
+
+        Equivalent to `model_dump(by_alias=True, exclude_none=True, exclude_unset=True)`
+        minus _BUILD_EXCLUDE. Only used for classes whose serializers it can apply
+        the way pydantic does, see `_fast_dump_supported()`.
+        """
+        values = self.__dict__
+        fields_set = self.__pydantic_fields_set__
+        params: Dict[str, Any] = {}
+        for name, alias, serializer in self._DUMP_FIELDS:
+            if name not in fields_set:
+                continue
+            value = values[name]
+            if value is None:
+                continue
+            if serializer is not None:
+                value = getattr(self, serializer)(value)
+            elif isinstance(value, (list, dict)):
+                value = value.copy()
+            params[alias] = value
+        for name, alias, constant in self._DUMP_COMPUTED:
+            value = getattr(self, name) if constant is None else constant
+            if value is not None:
+                params[alias] = value
         return params
 
-    def build(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    def with_configs(self, *configs: ParamsConfig) -> Self:
         """
-        Serialize the parser configuration to Solr-compatible query parameters using Pydantic's model_dump.
+        Attach already-built configs, e.g. ones shared across many queries.
+
+        Unlike `facet()`, `highlight()` and the other builders, the configs are not
+        validated again, and their cached Solr parameters are reused by `build()`.
+
+        Example:
+            ```python
+            facets = FacetParamsConfig(fields=["category"], mincount=1)
+            parser = StandardParser(query="laptop").with_configs(facets)
+            ```
         """
-        params = self.model_dump(
-            by_alias=True,
-            exclude_none=True,
-            exclude=["configs"],  # type: ignore[arg-type]
-            exclude_unset=True,
-            *args,
-            **kwargs,
-        )
-        return self.serialize_configs(params)
+        self.configs.extend(configs)
+        return self
 
     def facet(
         self,
@@ -134,38 +249,7 @@ class BaseQueryParser(CommonParamsMixin):
             Filtered facets:
             >>> parser.facet(fields=["color"], prefix="bl", mincount=5)
         """
-        self.configs.append(
-            FacetParamsConfig(
-                queries=queries,
-                fields=fields,
-                prefix=prefix,
-                contains=contains,
-                contains_ignore_case=contains_ignore_case,
-                matches=matches,
-                sort=sort,
-                limit=limit,
-                offset=offset,
-                mincount=mincount,
-                missing=missing,
-                method=method,
-                enum_cache_min_df=enum_cache_min_df,
-                exists=exists,
-                exclude_terms=exclude_terms,
-                overrequest_count=overrequest_count,
-                overrequest_ratio=overrequest_ratio,
-                threads=threads,
-                range_field=range_field,
-                range_start=range_start,
-                range_end=range_end,
-                range_gap=range_gap,
-                range_hardend=range_hardend,
-                range_include=range_include,
-                range_other=range_other,
-                range_method=range_method,
-                pivot_fields=pivot_fields,
-                pivot_mincount=pivot_mincount,
-            )
-        )
+        self.configs.append(FacetParamsConfig(**_given_options(locals())))
         return self
 
     def group(
@@ -226,20 +310,7 @@ class BaseQueryParser(CommonParamsMixin):
             Multiple field groupings:
             >>> parser.group(by=["author", "category"], limit=2)
         """
-        config = GroupParamsConfig(
-            by=by,
-            func=func,
-            query=query,
-            limit=limit,
-            offset=offset,
-            sort=sort,
-            format=format,
-            main=main,
-            ngroups=ngroups,
-            truncate=truncate,
-            facet=facet,
-            cache_percent=cache_percent,
-        )
+        config = GroupParamsConfig(**_given_options(locals()))
         self.configs.append(config)
         return self
 
@@ -395,56 +466,7 @@ class BaseQueryParser(CommonParamsMixin):
             ...     fragment_size=200
             ... )
         """
-        config = HighlightParamsConfig(
-            method=method,
-            fields=fields,
-            query=query,
-            query_parser=query_parser,
-            require_field_match=require_field_match,
-            query_field_pattern=query_field_pattern,
-            use_phrase_highlighter=use_phrase_highlighter,
-            multiterm=multiterm,
-            snippets_per_field=snippets_per_field,
-            fragment_size=fragment_size,
-            encoder=encoder,
-            max_analyzed_chars=max_analyzed_chars,
-            tag_before=tag_before,
-            tag_after=tag_after,
-            offset_source=offset_source,
-            frag_align_ratio=frag_align_ratio,
-            fragsize_is_minimum=fragsize_is_minimum,
-            tag_ellipsis=tag_ellipsis,
-            default_summary=default_summary,
-            score_k1=score_k1,
-            score_b=score_b,
-            score_pivot=score_pivot,
-            bs_language=bs_language,
-            bs_country=bs_country,
-            bs_variant=bs_variant,
-            bs_type=bs_type,
-            bs_separator=bs_separator,
-            weight_matches=weight_matches,
-            merge_contiguous=merge_contiguous,
-            max_multivalued_to_examine=max_multivalued_to_examine,
-            max_multivalued_to_match=max_multivalued_to_match,
-            alternate_field=alternate_field,
-            max_alternate_field_length=max_alternate_field_length,
-            alternate=alternate,
-            formatter=formatter,
-            simple_pre=simple_pre,
-            simple_post=simple_post,
-            fragmenter=fragmenter,
-            regex_slop=regex_slop,
-            regex_pattern=regex_pattern,
-            regex_max_analyzed_chars=regex_max_analyzed_chars,
-            preserve_multi=preserve_multi,
-            payloads=payloads,
-            frag_list_builder=frag_list_builder,
-            fragments_builder=fragments_builder,
-            boundary_scanner=boundary_scanner,
-            phrase_limit=phrase_limit,
-            multivalue_separator=multivalue_separator,
-        )
+        config = HighlightParamsConfig(**_given_options(locals()))
         self.configs.append(config)
         return self
 
@@ -532,21 +554,84 @@ class BaseQueryParser(CommonParamsMixin):
             ...     boost=True
             ... )
         """
-        config = MoreLikeThisParamsConfig(
-            fields=fields,
-            min_term_freq=min_term_freq,
-            min_doc_freq=min_doc_freq,
-            max_doc_freq=max_doc_freq,
-            max_doc_freq_pct=max_doc_freq_pct,
-            min_word_len=min_word_len,
-            max_word_len=max_word_len,
-            max_query_terms=max_query_terms,
-            max_num_tokens_parsed=max_num_tokens_parsed,
-            boost=boost,
-            query_fields=query_fields,
-            interesting_terms=interesting_terms,
-            match_include=match_include,
-            match_offset=match_offset,
-        )
+        options = _given_options(locals())
+        from taiyo.params.configs.more_like_this import MoreLikeThisParamsConfig
+
+        config = MoreLikeThisParamsConfig(**options)
         self.configs.append(config)
         return self
+
+
+def _given_options(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Keyword arguments a builder was actually given, taken from its locals()."""
+    return {
+        name: value
+        for name, value in arguments.items()
+        if name != "self" and value is not None
+    }
+
+
+def _compile_dump_tables(cls: type[BaseQueryParser]) -> None:
+    """Build the field tables read by BaseQueryParser._fast_dump().
+
+    Aliases are interned, as they become the keys of every build() result.
+    """
+    serializers = {
+        field: decorator.cls_var_name
+        for decorator in cls.__pydantic_decorators__.field_serializers.values()
+        for field in decorator.info.fields
+    }
+    exclude = cls._BUILD_EXCLUDE
+    cls._DUMP_FIELDS = tuple(
+        (name, sys.intern(field.alias or name), serializers.get(name))
+        for name, field in cls.model_fields.items()
+        if name not in exclude and not field.exclude
+    )
+    cls._DUMP_COMPUTED = tuple(
+        (name, sys.intern(field.alias or name), _literal_constant(field.return_type))
+        for name, field in cls.model_computed_fields.items()
+        if name not in exclude
+    )
+    cls._FAST_DUMP = _fast_dump_supported(cls)
+
+
+def _fast_dump_supported(cls: type[BaseQueryParser]) -> bool:
+    """Whether _fast_dump() reproduces model_dump() for the class.
+
+    It calls field serializers as `serializer(value)`, so every serializer must be
+    a plain `(self, value)` method that always applies and targets a model field.
+    Anything else, such as an `info` argument, `when_used="json"`, a serializer
+    on a computed field, a model serializer or a separate serialization alias,
+    is left to model_dump().
+    """
+    decorators = cls.__pydantic_decorators__
+    if decorators.model_serializers:
+        return False
+    for decorator in decorators.field_serializers.values():
+        info = decorator.info
+        if info.mode != "plain" or info.when_used != "always":
+            return False
+        if not set(info.fields) <= cls.model_fields.keys():
+            return False
+        parameters = inspect.signature(decorator.func).parameters.values()
+        if [p.kind for p in parameters] != [_POSITIONAL] * 2:
+            return False
+    return all(
+        field.serialization_alias in (None, field.alias)
+        for field in cls.model_fields.values()
+    )
+
+
+_POSITIONAL = inspect.Parameter.POSITIONAL_OR_KEYWORD
+
+
+def _literal_constant(annotation: Any) -> Any:
+    """The value of a single-valued Literal annotation, otherwise None."""
+    if get_origin(annotation) is Literal:
+        values = get_args(annotation)
+        if len(values) == 1:
+            return values[0]
+    return None
+
+
+_compile_dump_tables(BaseQueryParser)
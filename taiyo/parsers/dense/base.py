@@ -1,16 +1,52 @@
-from typing import Any, Dict
+from array import array
+from itertools import chain
+from typing import Annotated, Any, List, Optional, Tuple
+
+from pydantic import BeforeValidator
+
 from taiyo.parsers.base import BaseQueryParser
 from taiyo.params import DenseVectorSearchParamsMixin
+from taiyo.params.mixins.dense_vector_search import _format_params
 
 
 class DenseVectorSearchQueryParser(BaseQueryParser, DenseVectorSearchParamsMixin):
-    def build(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
-        params = self.model_dump(
-            by_alias=True,
-            exclude_none=True,
-            exclude_unset=True,
-            exclude=["configs", *DenseVectorSearchParamsMixin.get_mixin_keys()],  # type: ignore[arg-type]
-            *args,
-            **kwargs,
+    __slots__ = ()
+
+    _BUILD_EXCLUDE = frozenset(DenseVectorSearchParamsMixin.get_mixin_keys())
+
+    # q is built on every access rather than cached per parser: vector and
+    # pre_filter are lists callers may change in place, which no cache can see.
+
+    def _local_params(self, *params: Tuple[str, Any]) -> str:
+        """Join the parser's own (alias, value) params and vector_search_params.
+
+        None values are left out rather than sent to Solr as the string "None".
+        """
+        return " ".join(
+            chain(
+                chain.from_iterable(
+                    _format_params(alias, value) for alias, value in params
+                ),
+                (str(self.vector_search_params),),
+            )
         )
-        return self.serialize_configs(params)
+
+
+def _format_vector(vector: List[float], precision: Optional[int]) -> str:
+    """Render a query vector, rounding to `precision` significant digits if given."""
+    if precision is None:
+        return str(vector)
+    spec = f".{precision}g"
+    return "[" + ",".join([format(value, spec) for value in vector]) + "]"
+
+
+def _as_float_list(value: Any) -> Any:
+    """Accept packed float32 bytes and array-likes (e.g. numpy arrays) as vectors."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return array("f", value).tolist()
+    if not isinstance(value, list) and hasattr(value, "tolist"):
+        return value.tolist()
+    return value
+
+
+_Vector = Annotated[List[float], BeforeValidator(_as_float_list)]
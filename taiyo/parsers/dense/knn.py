@@ -1,6 +1,10 @@
-from typing import Optional, Literal
+from typing import ClassVar, Optional
 from pydantic import Field, computed_field
-from taiyo.parsers.dense.base import DenseVectorSearchQueryParser
+from taiyo.parsers.dense.base import (
+    DenseVectorSearchQueryParser,
+    _Vector,
+    _format_vector,
+)
 
 
 class KNNQueryParser(DenseVectorSearchQueryParser):
@@ -71,8 +75,9 @@ class KNNQueryParser(DenseVectorSearchQueryParser):
         ... )
 
     Args:
-        vector: Query vector as list of floats (required, must match field dimension)
+        vector: Query vector as list of floats, packed float32 bytes or an array with tolist() (required, must match field dimension)
         top_k: Number of nearest neighbors to return (default: 10)
+        vector_precision: Significant digits per vector component in the query string (default: full repr)
         vector_field: Name of the DenseVectorField to search (inherited from base)
         pre_filter: Explicit pre-filter query strings (inherited from base)
         include_tags: Only use fq filters with these tags for implicit pre-filtering (inherited)
@@ -90,7 +95,9 @@ class KNNQueryParser(DenseVectorSearchQueryParser):
         - KNNTextToVectorQueryParser: For text-to-vector conversion with KNN search
     """
 
-    vector: list[float] = Field(
+    __slots__ = ()
+
+    vector: _Vector = Field(
         ...,
         alias="vector",
         exclude=True,
@@ -102,9 +109,18 @@ class KNNQueryParser(DenseVectorSearchQueryParser):
         exclude=True,
         description="How many k-nearest results to return.",
     )
+    vector_precision: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=17,
+        exclude=True,
+        description="Significant digits per vector component in the query string; unset sends the full float repr.",
+    )
 
-    _def_type: Literal["knn"] = "knn"
+    _def_type: ClassVar[str] = "knn"
 
     @computed_field(alias="q")
     def query(self) -> str:
-        return f"{{!{self._def_type} topK={self.top_k} {self.vector_search_params}}}{self.vector}"
+        local_params = self._local_params(("topK", self.top_k))
+        vector = _format_vector(self.vector, self.vector_precision)
+        return f"{{!{self._def_type} {local_params}}}{vector}"
@@ -1,4 +1,4 @@
-from typing import Optional, Literal
+from typing import ClassVar, Optional
 from pydantic import Field, computed_field
 from taiyo.parsers.dense.base import DenseVectorSearchQueryParser
 
@@ -107,6 +107,8 @@ class KNNTextToVectorQueryParser(DenseVectorSearchQueryParser):
         - Solr Text-to-Vector Models Guide: https://solr.apache.org/guide/solr/latest/query-guide/text-to-vector.html
     """
 
+    __slots__ = ()
+
     text: str = Field(..., exclude=True, description="Text to search for.")
     model: Optional[str] = Field(
         default=None,
@@ -120,8 +122,9 @@ class KNNTextToVectorQueryParser(DenseVectorSearchQueryParser):
         description="How many k-nearest results to return.",
     )
 
-    _def_type: Literal["knn_text_to_vector"] = "knn_text_to_vector"
+    _def_type: ClassVar[str] = "knn_text_to_vector"
 
     @computed_field(alias="q")
     def query(self) -> str:
-        return f"{{!{self._def_type} model={self.model} topK={self.top_k} {self.vector_search_params}}}{self.text}"
+        local_params = self._local_params(("model", self.model), ("topK", self.top_k))
+        return f"{{!{self._def_type} {local_params}}}{self.text}"
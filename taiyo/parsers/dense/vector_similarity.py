@@ -1,7 +1,11 @@
-from typing import Optional, Literal
+from typing import ClassVar, Optional
 from pydantic import Field, computed_field
 
-from taiyo.parsers.dense.base import DenseVectorSearchQueryParser
+from taiyo.parsers.dense.base import (
+    DenseVectorSearchQueryParser,
+    _Vector,
+    _format_vector,
+)
 
 
 class VectorSimilarityQueryParser(DenseVectorSearchQueryParser):
@@ -74,9 +78,10 @@ class VectorSimilarityQueryParser(DenseVectorSearchQueryParser):
         ... )
 
     Args:
-        vector: Query vector as list of floats (required, must match field dimension)
+        vector: Query vector as list of floats, packed float32 bytes or an array with tolist() (required, must match field dimension)
         min_return: Minimum similarity threshold for returned documents (required)
         min_traverse: Minimum similarity to continue graph traversal (default: -Infinity)
+        vector_precision: Significant digits per vector component in the query string (default: full repr)
         vector_field: Name of the DenseVectorField to search (inherited from base)
         pre_filter: Explicit pre-filter query strings (inherited from base)
         include_tags: Only use fq filters with these tags for implicit pre-filtering (inherited)
@@ -94,7 +99,9 @@ class VectorSimilarityQueryParser(DenseVectorSearchQueryParser):
         - KNNTextToVectorQueryParser: For text-based vector similarity search
     """
 
-    vector: list[float] = Field(
+    __slots__ = ()
+
+    vector: _Vector = Field(
         ...,
         alias="vector",
         exclude=True,
@@ -112,9 +119,20 @@ class VectorSimilarityQueryParser(DenseVectorSearchQueryParser):
         exclude=True,
         description="Minimum similarity to continue traversal (vectorSimilarity).",
     )
+    vector_precision: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=17,
+        exclude=True,
+        description="Significant digits per vector component in the query string; unset sends the full float repr.",
+    )
 
-    _def_type: Literal["vectorSimilarity"] = "vectorSimilarity"
+    _def_type: ClassVar[str] = "vectorSimilarity"
 
     @computed_field(alias="q")
     def query(self) -> str:
-        return f"{{!{self._def_type} minTraverse={self.min_traverse} minReturn={self.min_return} {self.vector_search_params}}}{self.vector}"
+        local_params = self._local_params(
+            ("minTraverse", self.min_traverse), ("minReturn", self.min_return)
+        )
+        vector = _format_vector(self.vector, self.vector_precision)
+        return f"{{!{self._def_type} {local_params}}}{vector}"
@@ -91,6 +91,8 @@ class ExtendedDisMaxQueryParser(DisMaxQueryParser):
         - StandardParser: For pure Lucene syntax without DisMax features
     """
 
+    __slots__ = ()
+
     split_on_whitespace: Optional[bool] = Field(
         default=None,
         description="Split on whitespace. If true, analyze each whitespace-separated term separately.",
@@ -53,6 +53,8 @@ class StandardParser(BaseQueryParser):
         - ExtendedDisMaxQueryParser: For advanced user queries combining Lucene syntax with DisMax features
     """
 
+    __slots__ = ()
+
     query: str = Field(
         ...,
         alias="q",
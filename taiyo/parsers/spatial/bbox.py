@@ -1,4 +1,5 @@
-from typing import Literal, Optional
+from functools import lru_cache
+from typing import ClassVar, Literal, Optional, Tuple
 from pydantic import Field, computed_field, field_serializer
 from ..base import BaseQueryParser
 
@@ -140,6 +141,8 @@ class BBoxQueryParser(BaseQueryParser):
         - JTS Spatial: For complex polygon support
     """
 
+    __slots__ = ()
+
     bbox_field: str = Field(
         ...,
         description="Name of the BBoxField to query",
@@ -152,7 +155,7 @@ class BBoxQueryParser(BaseQueryParser):
         description="Spatial predicate to use",
     )
 
-    envelope: list[float] = Field(
+    envelope: Tuple[float, float, float, float] = Field(
         ...,
         description="Bounding box as [minX, maxX, maxY, minY]",
     )
@@ -162,15 +165,24 @@ class BBoxQueryParser(BaseQueryParser):
         description="Scoring mode for BBoxField queries",
     )
 
+    # Full query, from field, score local param, predicate and the envelope values.
+    _QUERY_FORMAT: ClassVar[str] = "{{!field f={}{}}}{}(ENVELOPE({}, {}, {}, {}))"
+
     @field_serializer("envelope", return_type=str)
-    def serialize_envelope(self, values: list[float]) -> str:
+    def serialize_envelope(self, values: Tuple[float, float, float, float]) -> str:
         """Serialize envelope to WKT ENVELOPE format."""
-        minX, maxX, maxY, minY = values
-        return f"ENVELOPE({minX}, {maxX}, {maxY}, {minY})"
+        return _format_envelope(tuple(values))
 
     @computed_field(alias="q")
     def query(self) -> str:
         """Constructs the BBoxField query with predicate and envelope."""
-        envelope_str = self.serialize_envelope(self.envelope)
         score_param = f" score={self.score}" if self.score else ""
-        return f"{{!field f={self.bbox_field}{score_param}}}{self.predicate}({envelope_str})"
+        return self._QUERY_FORMAT.format(
+            self.bbox_field, score_param, self.predicate, *self.envelope
+        )
+
+
+@lru_cache(maxsize=256)
+def _format_envelope(values: Tuple[float, float, float, float]) -> str:
+    """Envelope in WKT, shared by parsers querying the same box."""
+    return "ENVELOPE({}, {}, {}, {})".format(*values)
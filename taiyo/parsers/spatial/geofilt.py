@@ -110,6 +110,8 @@ class GeoFilterQueryParser(SpatialQueryParser):
         - Solr Spatial Search Guide: https://solr.apache.org/guide/solr/latest/query-guide/spatial-search.html
     """
 
+    __slots__ = ()
+
     filter_type: Literal["geofilt", "bbox"] = Field(
         default="geofilt",
         description="Type of spatial filter: 'geofilt' for circular (precise) or 'bbox' for bounding box (faster)",
@@ -104,6 +104,8 @@ class TermsQueryParser(BaseQueryParser):
         - DisMaxQueryParser: For multi-field user-friendly queries
     """
 
+    __slots__ = ()
+
     query: str = Field(
         "*:*",
         alias="q",
@@ -135,8 +137,8 @@ class TermsQueryParser(BaseQueryParser):
         description="Query implementation method. Options: termsFilter (default), booleanQuery, automaton, docValuesTermsFilter, docValuesTermsFilterPerSegment, docValuesTermsFilterTopLevel.",
     )
 
-    def build(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
-        params = super().build(*args, **kwargs)
+    def _dump_params(self, **kwargs: Any) -> Dict[str, Any]:
+        params = super()._dump_params(**kwargs)
         params.setdefault("q", self.query)
         return params
 
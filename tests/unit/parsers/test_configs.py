@@ -1,10 +1,27 @@
 """Tests for different ways to configure parser results with ParamsConfig objects."""
 
+import subprocess
+import sys
+from typing import List
+
+import pytest
+from pydantic import ValidationError, field_serializer
+
 from taiyo.params import (
     FacetParamsConfig,
+    FacetSort,
     GroupParamsConfig,
+    BreakIteratorType,
+    FragListBuilder,
+    Fragmenter,
+    FragmentsBuilder,
+    Formatter,
+    HighlightEncoder,
+    HighlightMethod,
     HighlightParamsConfig,
     MoreLikeThisParamsConfig,
+    RangeSpec,
+    highlight_params_to_solr,
 )
 from taiyo.parsers import StandardParser, DisMaxQueryParser
 
@@ -71,7 +88,7 @@ class TestConfigViaConstructor:
 
         assert params["q"] == "search term"
         assert params["hl"] is True
-        assert params["hl.fl"] == ["title", "content"]
+        assert params["hl.fl"] == "title,content"
         assert params["hl.snippets"] == 3
         assert params["hl.fragsize"] == 150
         assert params["hl.simple.pre"] == "<mark>"
@@ -136,7 +153,7 @@ class TestConfigViaConstructor:
 
         # Check highlight config
         assert params["hl"] is True
-        assert params["hl.fl"] == ["description"]
+        assert params["hl.fl"] == "description"
         assert params["hl.fragsize"] == 100
 
     def test_dismax_with_configs_in_constructor(self):
@@ -211,7 +228,7 @@ class TestConfigViaChaining:
 
         assert params["q"] == "search term"
         assert params["hl"] is True
-        assert params["hl.fl"] == ["title", "content"]
+        assert params["hl.fl"] == "title,content"
         assert params["hl.snippets"] == 3
         assert params["hl.fragsize"] == 150
         assert params["hl.simple.pre"] == "<mark>"
@@ -270,7 +287,7 @@ class TestConfigViaChaining:
 
         # Check highlight config
         assert params["hl"] is True
-        assert params["hl.fl"] == ["description"]
+        assert params["hl.fl"] == "description"
         assert params["hl.fragsize"] == 100
 
     def test_dismax_with_chaining(self):
@@ -358,7 +375,7 @@ class TestMixedConfigApproaches:
 
         # Check highlight config from constructor
         assert params["hl"] is True
-        assert params["hl.fl"] == ["title"]
+        assert params["hl.fl"] == "title"
         assert params["hl.fragsize"] == 200
 
         # Check group config from chaining
@@ -411,6 +428,41 @@ class TestRangeFaceting:
         assert params["facet.range.end"] == {"price": "1000"}
         assert params["facet.range.gap"] == {"price": "100"}
 
+    def test_range_facet_via_range_specs(self):
+        """Test that range_specs expands into the per-field range params."""
+        facet_config = FacetParamsConfig(
+            range_specs={"price": RangeSpec(start="0", end="1000", gap="100")}
+        )
+        params = StandardParser(query="*:*", configs=[facet_config]).build()
+
+        assert params["facet.range"] == ["price"]
+        assert params["facet.range.start"] == {"price": "0"}
+        assert params["facet.range.end"] == {"price": "1000"}
+        assert params["facet.range.gap"] == {"price": "100"}
+        assert facet_config.range_specs == {"price": RangeSpec("0", "1000", "100")}
+
+    def test_range_specs_accept_sequences_and_mappings(self):
+        """Test that range_specs entries may be sequences or mappings."""
+        facet_config = FacetParamsConfig(
+            range_specs={
+                "price": ["0", "1000", "100"],
+                "date": {"start": "NOW-1YEAR", "end": "NOW", "gap": "+1MONTH"},
+            }
+        )
+        assert facet_config.range_specs == {
+            "price": RangeSpec("0", "1000", "100"),
+            "date": RangeSpec("NOW-1YEAR", "NOW", "+1MONTH"),
+        }
+
+        with pytest.raises(ValidationError):
+            FacetParamsConfig(
+                range_specs={"price": {"low": "0", "high": "1", "by": "1"}}
+            )
+        with pytest.raises(ValidationError):
+            FacetParamsConfig(range_specs={"price": ["0", "1000"]})
+        with pytest.raises(ValidationError):
+            FacetParamsConfig(range_specs={"price": "abc"})
+
 
 class TestGroupByQuery:
     """Test group-by-query configurations."""
@@ -472,9 +524,9 @@ class TestAdvancedHighlighting:
         params = parser.build()
 
         assert params["hl"] is True
-        assert params["hl.fl"] == ["content"]
-        # method is returned as enum, convert to string for comparison
-        assert str(params["hl.method"]).split(".")[-1] == "UNIFIED"
+        assert params["hl.fl"] == "content"
+        assert type(params["hl.method"]) is str
+        assert params["hl.method"] == "unified"
         assert params["hl.offsetSource"] == "POSTINGS"
         assert params["hl.tag.pre"] == "<em class='highlight'>"
         assert params["hl.tag.post"] == "</em>"
@@ -493,10 +545,356 @@ class TestAdvancedHighlighting:
         params = parser.build()
 
         assert params["hl"] is True
-        assert params["hl.fl"] == ["content"]
-        # method is returned as enum, convert to string for comparison
-        assert str(params["hl.method"]).split(".")[-1] == "UNIFIED"
+        assert params["hl.fl"] == "content"
+        assert type(params["hl.method"]) is str
+        assert params["hl.method"] == "unified"
         assert params["hl.offsetSource"] == "POSTINGS"
         assert params["hl.tag.pre"] == "<em class='highlight'>"
         assert params["hl.tag.post"] == "</em>"
         assert params["hl.maxAnalyzedChars"] == 500000
+
+
+class TestFacetGroupConfigOptions:
+    """Test model options on facet and group configs."""
+
+    def test_facet_enums_stored_as_values(self):
+        """Test that enum fields hold plain strings ready for request params."""
+        config = FacetParamsConfig(sort="count", method="fc", range_other=["all"])
+
+        assert type(config.sort) is str
+        assert config.method == "fc"
+        assert config.range_other == ["all"]
+
+    def test_configs_are_frozen(self):
+        """Test that configs cannot be modified after construction."""
+        facet_config = FacetParamsConfig(fields=["category"])
+        group_config = GroupParamsConfig(by="author")
+        highlight_config = HighlightParamsConfig(fields=["title"])
+
+        with pytest.raises(ValidationError):
+            facet_config.limit = 10
+        with pytest.raises(ValidationError):
+            group_config.limit = 10
+        with pytest.raises(ValidationError):
+            highlight_config.fragment_size = 10
+
+    def test_unknown_fields_rejected(self):
+        """Test that misspelled options raise instead of being dropped."""
+        with pytest.raises(ValidationError):
+            FacetParamsConfig(feilds=["category"])
+        with pytest.raises(ValidationError):
+            GroupParamsConfig(**{"group.field": "author"})
+
+
+class TestToSolrParams:
+    """Test the direct alias-keyed emission of config params."""
+
+    def test_matches_model_dump(self):
+        """Test that to_solr_params agrees with the equivalent model_dump call."""
+        configs = [
+            FacetParamsConfig(fields=["category"], sort="index", range_gap={"p": "10"}),
+            GroupParamsConfig(by="author", limit=3, main=None),
+            HighlightParamsConfig(
+                fields="title", method="unified", snippets_per_field=2
+            ),
+            MoreLikeThisParamsConfig(fields=["body"], min_term_freq=1),
+        ]
+        for config in configs:
+            assert config.to_solr_params() == config.model_dump(
+                by_alias=True, exclude_none=True, exclude_unset=True
+            )
+
+    def test_skips_unset_and_none_values(self):
+        """Test that defaults and explicit None values are not emitted."""
+        config = GroupParamsConfig(by="author", sort=None)
+
+        assert config.to_solr_params() == {"group.field": "author"}
+
+    def test_facet_enum_strings_coerced(self):
+        """Test that string values for facet enum fields validate via the lookup."""
+        config = FacetParamsConfig(sort="index", method="fcs", range_method="dv")
+
+        assert config.to_solr_params() == {
+            "facet.sort": "index",
+            "facet.method": "fcs",
+            "facet.range.method": "dv",
+        }
+        with pytest.raises(ValidationError):
+            FacetParamsConfig(sort="alphabetical")
+
+    def test_configs_have_no_weakref_slot(self):
+        """Test that facet and group configs carry no per-instance weakref slot."""
+        assert not hasattr(FacetParamsConfig(), "__weakref__")
+        assert not hasattr(GroupParamsConfig(), "__weakref__")
+        assert not hasattr(HighlightParamsConfig(), "__weakref__")
+
+    def test_facet_matches_pattern_compiled(self):
+        """Test that matches is compiled client-side without rejecting Java syntax."""
+        config = FacetParamsConfig(fields=["color"], matches="^bl.*")
+        java_only = FacetParamsConfig(fields=["color"], matches=r"\p{Lu}.*")
+
+        assert (
+            config.matches_pattern is FacetParamsConfig(matches="^bl.*").matches_pattern
+        )
+        assert config.matches_pattern.match("blue")
+        assert java_only.matches_pattern is None
+        assert java_only.to_solr_params()["facet.matches"] == r"\p{Lu}.*"
+
+    def test_cacheable_key(self):
+        """Test that equal parameter sets share a cache key and others do not."""
+        first = FacetParamsConfig(
+            fields=["category"], mincount=1, range_gap={"a": "1", "b": "2"}
+        )
+        second = FacetParamsConfig(
+            range_gap={"b": "2", "a": "1"}, mincount=1, fields=["category"]
+        )
+        other = FacetParamsConfig(fields=["category"], mincount=2)
+
+        assert first.cacheable_key() == second.cacheable_key()
+        assert first.cacheable_key() != other.cacheable_key()
+        assert len(first.cacheable_key()) == 16
+        assert GroupParamsConfig(by="a").cacheable_key() != (
+            HighlightParamsConfig(fields="a").cacheable_key()
+        )
+
+    def test_group_values_normalized_to_tuples(self):
+        """Test that group by/query are stored as tuples and emitted as before."""
+        single = GroupParamsConfig(by="author")
+        multiple = GroupParamsConfig(by=["author", "year"], query=["a:1"])
+
+        assert single.by == ("author",)
+        assert multiple.by == ("author", "year")
+        assert single.to_solr_params() == {"group.field": "author"}
+        assert multiple.to_solr_params() == {
+            "group.field": ["author", "year"],
+            "group.query": "a:1",
+        }
+        assert multiple.model_dump(by_alias=True, exclude_unset=True) == (
+            multiple.to_solr_params()
+        )
+
+    def test_group_schema_descriptions_loaded_from_sidecar(self):
+        """Test that group field descriptions still appear in the JSON schema."""
+        schema = GroupParamsConfig.model_json_schema(mode="serialization")
+
+        assert GroupParamsConfig.model_fields["by"].description is None
+        assert schema["properties"]["group.field"]["description"].startswith(
+            "Field(s) to group results by."
+        )
+
+    def test_highlight_adapter_validates_dicts_and_json(self):
+        """Test that the shared adapter builds highlight configs."""
+        from taiyo.params.configs.highlight import HIGHLIGHT_ADAPTER
+
+        from_dict = HIGHLIGHT_ADAPTER.validate_python({"fields": ["title"]})
+        from_json = HIGHLIGHT_ADAPTER.validate_json(b'{"fields": ["title"]}')
+
+        assert isinstance(from_dict, HighlightParamsConfig)
+        assert from_dict.to_solr_params() == {"hl.fl": "title"}
+        assert from_json.to_solr_params() == from_dict.to_solr_params()
+
+    def test_from_trusted_skips_validation(self):
+        """Test that from_trusted stores values as given and emits them."""
+        config = HighlightParamsConfig.from_trusted(fields=["title"], fragment_size=150)
+
+        assert isinstance(config, HighlightParamsConfig)
+        assert config.enable_key == "hl"
+        assert config.to_solr_params() == {"hl.fl": "title", "hl.fragsize": 150}
+        assert (
+            HighlightParamsConfig.from_trusted(fragment_size="x").fragment_size == "x"
+        )
+
+    def test_highlight_enum_values_unwrapped(self):
+        """Test that highlight enum members are emitted as their plain values."""
+        config = HighlightParamsConfig(
+            method="fastVector", encoder="html", bs_type="WORD"
+        )
+
+        assert config.to_solr_params() == {
+            "hl.method": "fastVector",
+            "hl.encoder": "html",
+            "hl.bs.type": "WORD",
+        }
+        assert all(type(v) is str for v in config.to_solr_params().values())
+
+    def test_highlight_enum_fields_store_plain_strings(self):
+        """Test that highlight enum fields accept strings or members and store strings."""
+        from taiyo import HighlightEncoder, HighlightMethod
+
+        config = HighlightParamsConfig(method=HighlightMethod.UNIFIED, encoder="")
+
+        assert type(config.method) is str
+        assert config.method == "unified"
+        assert config.encoder == HighlightEncoder.EMPTY
+        with pytest.raises(ValidationError):
+            HighlightParamsConfig(method="plain")
+
+    def test_highlight_takes_aliases_only_through_from_solr_dict(self):
+        """Test that highlight configs, like the others, reject hl.* keywords."""
+        by_name = HighlightParamsConfig(fields=["title"], fragment_size=100)
+        by_alias = HighlightParamsConfig.from_solr_dict(
+            {"hl.fl": "title", "hl.fragsize": 100}
+        )
+
+        assert by_alias.to_solr_params() == by_name.to_solr_params()
+        with pytest.raises(ValidationError):
+            HighlightParamsConfig.model_validate({"hl.fl": "title"})
+
+    def test_highlight_params_dict_to_solr(self):
+        """Test converting a plain highlight options dict to Solr params."""
+        from taiyo.params import HighlightParamsDict, highlight_params_to_solr
+
+        options: HighlightParamsDict = {
+            "fields": ["title", "body"],
+            "snippets_per_field": 2,
+            "tag_before": None,
+        }
+
+        assert highlight_params_to_solr(options) == {
+            "hl": True,
+            "hl.fl": "title,body",
+            "hl.snippets": 2,
+        }
+
+    def test_highlight_schema_descriptions_loaded_from_sidecar(self):
+        """Test that highlight field descriptions still appear in the JSON schema."""
+        schema = HighlightParamsConfig.model_json_schema(mode="serialization")
+
+        assert HighlightParamsConfig.model_fields["method"].description is None
+        assert schema["properties"]["hl.method"]["description"].startswith(
+            "Highlighting implementation to use."
+        )
+        assert schema["properties"]["hl.bs.separator"]["description"] == (
+            "Custom separator character when bs_type=SEPARATOR.\n\n"
+            "Example: '\\n' to break on newlines, '|' for pipe-separated text."
+        )
+
+    def test_from_solr_dict(self):
+        """Test building configs from Solr parameter dicts."""
+        highlight = HighlightParamsConfig.from_solr_dict(
+            {"hl": "true", "hl.fl": "title,body", "hl.snippets": "3"}
+        )
+        group = GroupParamsConfig.from_solr_dict(
+            {"group.field": "author", "group.limit": 2}, trusted=True
+        )
+
+        assert highlight.fields == ("title,body",)
+        assert highlight.snippets_per_field == 3
+        assert highlight.to_solr_params() == {"hl.fl": "title,body", "hl.snippets": 3}
+        assert group.to_solr_params() == {"group.field": "author", "group.limit": 2}
+
+    def test_highlight_patterns_compiled(self):
+        """Test that highlight regex options expose cached compiled patterns."""
+        config = HighlightParamsConfig(
+            query_field_pattern=".*_text$", regex_pattern=r"[\p{L}]+"
+        )
+
+        assert config.query_field_pattern_re.match("body_text")
+        assert (
+            config.query_field_pattern_re
+            is HighlightParamsConfig(
+                query_field_pattern=".*_text$"
+            ).query_field_pattern_re
+        )
+        assert config.regex_pattern_re is None
+        assert HighlightParamsConfig().query_field_pattern_re is None
+
+    def test_to_solr_params_cached_per_instance(self):
+        """Test that serialized params are reused and not shared with copies."""
+        config = HighlightParamsConfig(fields=["title"], snippets_per_field=2)
+
+        first = config.to_solr_params()
+        first["hl.snippets"] = 99
+        assert config.to_solr_params() == {"hl.fl": "title", "hl.snippets": 2}
+
+        with pytest.raises(ValidationError):
+            config.snippets_per_field = 5
+
+        facet = FacetParamsConfig(fields=["category"])
+        facet.to_solr_params()["facet.field"].append("brand")
+        assert facet.fields == ["category"]
+        copied = facet.model_copy(update={"mincount": 1})
+        assert copied.to_solr_params() == {
+            "facet.field": ["category"],
+            "facet.mincount": 1,
+        }
+
+    def test_subclass_field_serializers_applied(self):
+        """Test that serializers on a user config shape its emitted params."""
+
+        class JoinedFacetConfig(FacetParamsConfig):
+            @field_serializer("fields")
+            def serialize_fields(self, value: List[str]) -> str:
+                return ",".join(value)
+
+        config = JoinedFacetConfig(fields=["a", "b"], mincount=1)
+
+        assert config.to_solr_params() == {"facet.field": "a,b", "facet.mincount": 1}
+        parser = StandardParser(query="x").with_configs(config)
+        assert parser.build()["facet.field"] == "a,b"
+
+    def test_trusted_highlight_enums_unwrapped(self):
+        """Test that enum members passed to from_trusted() are sent as values."""
+        config = HighlightParamsConfig.from_trusted(
+            method=HighlightMethod.UNIFIED,
+            encoder=HighlightEncoder.HTML,
+            bs_type=BreakIteratorType.SENTENCE,
+            formatter=Formatter.SIMPLE,
+            fragmenter=Fragmenter.REGEX,
+            frag_list_builder=FragListBuilder.WEIGHTED,
+            fragments_builder=FragmentsBuilder.COLORED,
+        )
+
+        params = config.to_solr_params()
+
+        assert all(type(value) is str for value in params.values())
+        assert params["hl.fragmentsBuilder"] == "colored"
+
+    def test_highlight_params_dict_round_trip(self):
+        """Test converting a highlight config to a plain options dict and back."""
+        config = HighlightParamsConfig(
+            fields=["title", "body"], snippets_per_field=2, fragment_size=None
+        )
+
+        options = config.to_params_dict()
+
+        assert options == {"fields": ["title", "body"], "snippets_per_field": 2}
+        assert highlight_params_to_solr(options) == {
+            "hl": True,
+            **config.to_solr_params(),
+        }
+        assert HighlightParamsConfig.from_trusted(**options).to_solr_params() == (
+            config.to_solr_params()
+        )
+
+    def test_trusted_facet_enums_unwrapped(self):
+        """Test that enum members are sent as their values."""
+        config = FacetParamsConfig.from_trusted(
+            fields=["category"], sort=FacetSort.INDEX
+        )
+
+        assert config.to_solr_params() == {
+            "facet.field": ["category"],
+            "facet.sort": "index",
+        }
+        assert type(config.to_solr_params()["facet.sort"]) is str
+
+
+class TestLazyImports:
+    """Test that optional configs and parsers load on first access."""
+
+    def test_import_taiyo_defers_parsers_and_mlt(self):
+        code = (
+            "import sys, taiyo\n"
+            "assert 'taiyo.params.configs.more_like_this' not in sys.modules\n"
+            "assert 'taiyo.parsers.sparse' not in sys.modules\n"
+            "assert taiyo.StandardParser.__name__ == 'StandardParser'\n"
+            "assert taiyo.MoreLikeThisParamsConfig.__name__ == 'MoreLikeThisParamsConfig'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute_raises(self):
+        import taiyo.parsers
+
+        with pytest.raises(AttributeError):
+            taiyo.parsers.NotAParser  # noqa: B018
@@ -1,3 +1,8 @@
+from array import array
+
+import pytest
+from pydantic import ValidationError
+
 from taiyo.parsers import (
     KNNQueryParser,
     KNNTextToVectorQueryParser,
@@ -98,4 +103,84 @@ def test_knn_with_multiple_configs():
     assert result["hl"] is True
     assert result["facet.field"] == ["category"]
     assert result["group.field"] == "product_id"
-    assert result["hl.fl"] == ["title"]
+    assert result["hl.fl"] == "title"
+
+
+def test_knn_vector_search_params_refresh_on_assignment():
+    parser = KNNQueryParser(field="vector", top_k=5, vector=[1.0, 2.0])
+    assert parser.build()["q"] == "{!knn topK=5 f=vector}[1.0, 2.0]"
+
+    parser.pre_filter = ["inStock:true"]
+    assert (
+        parser.build()["q"] == "{!knn topK=5 f=vector preFilter=inStock:true}[1.0, 2.0]"
+    )
+
+    parser.vector = [3.0, 4.0]
+    parser.top_k = 2
+    assert (
+        parser.build()["q"] == "{!knn topK=2 f=vector preFilter=inStock:true}[3.0, 4.0]"
+    )
+
+
+def test_knn_vector_search_params_follow_in_place_mutation():
+    parser = KNNQueryParser(field="vector", vector=[1.0], pre_filter=["a:b"])
+    assert parser.vector_search_params == "f=vector preFilter=a:b"
+
+    parser.pre_filter.append("c:d")
+    assert parser.vector_search_params == "f=vector preFilter=a:b preFilter=c:d"
+
+    parser.vector.append(2.0)
+    assert parser.build()["q"] == (
+        "{!knn topK=10 f=vector preFilter=a:b preFilter=c:d}[1.0, 2.0]"
+    )
+
+
+def test_unset_local_params_are_omitted():
+    parser = VectorSimilarityQueryParser(field="vector", min_return=0.7, vector=[1.0])
+    assert parser.build()["q"] == "{!vectorSimilarity minReturn=0.7 f=vector}[1.0]"
+
+    parser = KNNTextToVectorQueryParser(field="vector", text="hello", top_k=3)
+    assert parser.build()["q"] == "{!knn_text_to_vector topK=3 f=vector}hello"
+
+
+def test_vector_precision_rounds_components():
+    parser = KNNQueryParser(
+        field="vector", vector=[0.30000000000000004, 1.0], vector_precision=8
+    )
+    assert parser.build()["q"] == "{!knn topK=10 f=vector}[0.3,1]"
+
+
+def test_vector_accepts_packed_float32_and_array_likes():
+    packed = array("f", [0.5, 2.0]).tobytes()
+    parser = KNNQueryParser(field="vector", vector=packed)
+    assert parser.vector == [0.5, 2.0]
+
+    parser = VectorSimilarityQueryParser(
+        field="vector", min_return=0.5, vector=array("d", [1.0, 3.0])
+    )
+    assert parser.build()["q"] == "{!vectorSimilarity minReturn=0.5 f=vector}[1.0, 3.0]"
+
+    with pytest.raises(ValidationError):
+        KNNQueryParser(field="vector", vector=b"\x00\x01\x02")
+
+
+def test_from_trusted_builds_like_constructor():
+    kwargs = dict(field="vector", vector=[1.0, 2.0], top_k=3, pre_filter=["a:b"])
+    trusted = KNNQueryParser.from_trusted(**kwargs)
+    assert trusted.build() == KNNQueryParser(**kwargs).build()
+    assert trusted.model_fields_set == set(kwargs)
+
+
+def test_local_param_values_quoted_when_needed():
+    parser = KNNTextToVectorQueryParser(
+        field="vector",
+        text="sets like {a, b}",
+        model="my model",
+        top_k=3,
+        pre_filter=["published:[2020 TO *]", "author:o'brien"],
+    )
+    assert parser.build()["q"] == (
+        "{!knn_text_to_vector model='my model' topK=3 f=vector "
+        "preFilter='published:[2020 TO *]' preFilter='author:o\\'brien'}"
+        "sets like {a, b}"
+    )
@@ -1,5 +1,14 @@
+import json
+from typing import List
+
+from pydantic import SerializationInfo, field_serializer
+
 from taiyo.params import FacetParamsConfig
-from taiyo.parsers import StandardParser, DisMaxQueryParser
+from taiyo.parsers import (
+    DisMaxQueryParser,
+    ExtendedDisMaxQueryParser,
+    StandardParser,
+)
 
 
 def test_lucene():
@@ -44,3 +53,124 @@ def test_dismax():
     assert params["bf"] == ["recip(rord(myfield),1,2,3)"]
     assert params["facet"]
     assert params["facet.query"] == ["facet true"]
+
+
+def test_dismax_build_matches_model_dump():
+    parser = DisMaxQueryParser(
+        query="foo bar",
+        query_fields={"title": 2.0, "body": 1.0},
+        boost_queries=["cat:electronics^5.0"],
+        rows=None,
+    )
+    params = parser.build()
+    assert list(params.items()) == list(parser.build(round_trip=False).items())
+    assert "rows" not in params
+
+    params["bq"].append("cat:books")
+    assert parser.boost_queries == ["cat:electronics^5.0"]
+
+
+def test_build_keyword_arguments_override_defaults():
+    parser = DisMaxQueryParser(query="foo bar", rows=5)
+    params = parser.build(by_alias=False)
+    assert params["query"] == "foo bar"
+    assert params["rows"] == 5
+
+
+def test_field_list_keeps_caller_type():
+    assert StandardParser(query="foo", field_list="id").build()["fl"] == "id"
+
+    parser = StandardParser(query="foo", field_list=["id"])
+    parser.field_list.append("score")
+    assert parser.build()["fl"] == ["id", "score"]
+
+
+def test_from_trusted_builds_like_constructor():
+    trusted = DisMaxQueryParser.from_trusted(
+        query="foo", query_fields={"title": 2.0}, rows=5
+    )
+    validated = DisMaxQueryParser(query="foo", query_fields={"title": 2.0}, rows=5)
+
+    assert (
+        trusted.facet(fields=["category"]).build()
+        == validated.facet(fields=["category"]).build()
+    )
+
+
+def test_configs_not_shared_or_dumped():
+    first = StandardParser(query="foo").facet(fields=["category"])
+    second = StandardParser(query="bar")
+
+    assert second.configs == []
+    assert "configs" not in first.model_dump()
+
+
+def test_build_json_matches_build():
+    parser = (
+        DisMaxQueryParser(query="foo bar", query_fields={"title": 2.0})
+        .facet(fields=["category"], mincount=1)
+        .highlight(fields=["title"])
+    )
+    assert json.loads(parser.build_json()) == parser.build()
+    assert parser.configs[0].to_json_fragment() == (
+        b'"facet":true,"facet.field":["category"],"facet.mincount":1'
+    )
+
+    repeated = StandardParser(query="*:*").facet(fields=["a"]).facet(fields=["b"])
+    assert json.loads(repeated.build_json()) == repeated.build()
+
+
+def test_with_configs_shares_config():
+    facets = FacetParamsConfig(fields=["category"], mincount=1)
+    first = StandardParser(query="a").with_configs(facets)
+    second = StandardParser(query="b").with_configs(facets)
+
+    assert first.configs[0] is second.configs[0] is facets
+    assert (
+        first.build()
+        == StandardParser(query="a").facet(fields=["category"], mincount=1).build()
+    )
+
+
+def test_build_output_does_not_alias_configs():
+    parser = StandardParser(query="x").facet(fields=["a", "b"])
+    parser.build()["facet.field"].append("c")
+
+    assert parser.configs[0].fields == ["a", "b"]
+    assert parser.build()["facet.field"] == ["a", "b"]
+
+
+def test_boost_terms_follow_in_place_changes():
+    parser = DisMaxQueryParser(query="foo", query_fields={"title": 2.0})
+    assert parser.build()["qf"] == "title^2.0"
+
+    parser.query_fields["body"] = 1.0
+    assert parser.build()["qf"] == "title^2.0 body^1.0"
+
+
+def test_constant_def_type_emitted_like_model_dump():
+    parser = ExtendedDisMaxQueryParser(query="foo", query_fields={"title": 2.0})
+    params = parser.build()
+    assert params["defType"] == "edismax"
+    assert list(params.items()) == list(parser.build(round_trip=False).items())
+
+
+def test_subclass_serializers_applied_like_model_dump():
+    class InfoParser(StandardParser):
+        @field_serializer("filters")
+        def serialize_filters(self, value: List[str], info: SerializationInfo) -> str:
+            return " AND ".join(value)
+
+    class JsonOnlyParser(StandardParser):
+        @field_serializer("filters", when_used="json")
+        def serialize_filters(self, value: List[str]) -> str:
+            return " AND ".join(value)
+
+    info_parser = InfoParser(query="x", filters=["a:1", "b:2"])
+    assert info_parser.build()["fq"] == "a:1 AND b:2"
+
+    json_only = JsonOnlyParser(query="x", filters=["a:1", "b:2"])
+    assert json_only.build()["fq"] == ["a:1", "b:2"]
+    assert json_only.build() == json_only.model_dump(
+        by_alias=True, exclude_none=True, exclude_unset=True
+    )
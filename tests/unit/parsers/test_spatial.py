@@ -1,5 +1,7 @@
-from taiyo.parsers import GeoFilterQueryParser
-from taiyo.parsers.spatial.bbox import BBoxQueryParser
+import pytest
+from pydantic import ValidationError
+
+from taiyo.parsers import BBoxQueryParser, GeoFilterQueryParser
 
 
 def test_geofilt_as_bbox_minimal():
@@ -139,5 +141,51 @@ def test_bbox_parser_with_highlight_config():
     # Check that both bbox params and highlight params are present
     assert "q" in result
     assert result["hl"] is True
-    assert result["hl.fl"] == ["name", "description"]
+    assert result["hl.fl"] == "name,description"
     assert result["hl.snippets"] == 3
+
+
+def test_geofilt_spatial_params_refresh_on_assignment():
+    """Test that spatial params follow field updates and copies."""
+    parser = GeoFilterQueryParser(
+        spatial_field="store", center_point=[45.15, -93.85], radial_distance=5
+    )
+    assert parser.build()["fq"] == "{!geofilt sfield=store pt=45.15,-93.85 d=5.0}"
+
+    parser.radial_distance = 10
+    assert parser.build()["fq"] == "{!geofilt sfield=store pt=45.15,-93.85 d=10}"
+
+    copied = parser.model_copy(update={"center_point": [1.0, 2.0]})
+    assert copied.build()["fq"] == "{!geofilt sfield=store pt=1.0,2.0 d=10}"
+
+    copied.center_point[0] = 3.0
+    assert copied.build()["fq"] == "{!geofilt sfield=store pt=3.0,2.0 d=10}"
+
+
+def test_bbox_field_query_refresh_on_assignment():
+    parser = BBoxQueryParser(bbox_field="location", envelope=[-10, 20, 15, 10])
+    assert parser.build()["q"] == (
+        "{!field f=location}Intersects(ENVELOPE(-10.0, 20.0, 15.0, 10.0))"
+    )
+
+    parser.predicate = "Within"
+    parser.score = "area"
+    assert parser.build()["q"] == (
+        "{!field f=location score=area}Within(ENVELOPE(-10.0, 20.0, 15.0, 10.0))"
+    )
+
+    trusted = BBoxQueryParser.from_trusted(
+        bbox_field="location", envelope=[1.0, 2.0, 3.0, 4.0]
+    )
+    trusted.envelope[0] = 9.0
+    assert trusted.build()["q"] == (
+        "{!field f=location}Intersects(ENVELOPE(9.0, 2.0, 3.0, 4.0))"
+    )
+
+
+def test_bbox_envelope_requires_four_values():
+    with pytest.raises(ValidationError):
+        BBoxQueryParser(bbox_field="location", envelope=[-10, 20, 15])
+
+    parser = BBoxQueryParser(bbox_field="location", envelope=[-10, 20, 15, 10])
+    assert parser.envelope == (-10.0, 20.0, 15.0, 10.0)
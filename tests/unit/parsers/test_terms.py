@@ -250,7 +250,7 @@ class TestTermsQueryParserConfigs:
         params = parser.build()
 
         assert params["hl"] is True
-        assert params["hl.fl"] == ["title", "description"]
+        assert params["hl.fl"] == "title,description"
         assert params["hl.fragsize"] == 150
 
     def test_chained_configs(self):
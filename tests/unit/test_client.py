@@ -1,5 +1,6 @@
 """Tests for the SolrClient and AsyncSolrClient classes."""
 
+import json
 import pytest
 import httpx
 from httpx import Response
@@ -96,6 +97,29 @@ async def test_async_add_multiple_documents(
     assert response["responseHeader"]["status"] == 0
 
 
+@pytest.mark.asyncio
+async def test_async_add_documents_streamed(
+    async_solr_client: AsyncSolrClient, monkeypatch, sample_docs
+):
+    """Test adding documents with a streamed request body."""
+
+    async def mock_request(*args, **kwargs):
+        assert kwargs["json"] is None
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+        body = b"".join([chunk async for chunk in kwargs["content"]])
+        expected_json = [doc.model_dump(exclude_unset=True) for doc in sample_docs]
+        assert json.loads(body) == expected_json
+        request = httpx.Request("POST", "http://localhost:8983", content=body)
+        response = Response(200, json=mock_update_response())
+        response._request = request
+        return response
+
+    monkeypatch.setattr(async_solr_client._client, "request", mock_request)
+    async_solr_client.set_collection(collection)
+    response = await async_solr_client.add(sample_docs, stream=True)
+    assert response["responseHeader"]["status"] == 0
+
+
 @pytest.mark.asyncio
 async def test_async_delete_by_ids(async_solr_client: AsyncSolrClient, monkeypatch):
     """Test deleting documents by ID."""
@@ -186,6 +210,53 @@ async def test_async_delete_combined(async_solr_client: AsyncSolrClient, monkeyp
     assert response["responseHeader"]["status"] == 0
 
 
+@pytest.mark.asyncio
+async def test_async_delete_many(async_solr_client: AsyncSolrClient, monkeypatch):
+    """Test deleting IDs in batches with a single commit at the end."""
+    ids = [str(i) for i in range(5)]
+    deleted = []
+    commits = []
+
+    async def mock_request(*args, **kwargs):
+        if kwargs["json"] is None:
+            commits.append(kwargs["params"])
+        else:
+            assert kwargs["params"] == {}
+            deleted.append(kwargs["json"]["delete"])
+        request = httpx.Request("POST", "http://localhost:8983")
+        response = Response(200, json=mock_delete_response())
+        response._request = request
+        return response
+
+    monkeypatch.setattr(async_solr_client._client, "request", mock_request)
+    async_solr_client.set_collection(collection)
+    responses = await async_solr_client.delete_many(ids, batch_size=2)
+    assert len(responses) == 3
+    assert sorted(map(str, deleted)) == sorted(map(str, [["0", "1"], ["2", "3"], "4"]))
+    assert commits == [{"commit": "true"}]
+
+
+@pytest.mark.asyncio
+async def test_async_delete_many_invalid_batch_size(
+    async_solr_client: AsyncSolrClient,
+):
+    """Test that a non-positive batch size is rejected."""
+    async_solr_client.set_collection(collection)
+    with pytest.raises(ValueError):
+        await async_solr_client.delete_many(["1"], batch_size=0)
+
+
+@pytest.mark.asyncio
+async def test_async_delete_many_invalid_max_concurrency(
+    async_solr_client: AsyncSolrClient,
+):
+    """Test that a non-positive max_concurrency is rejected instead of hanging."""
+    async_solr_client.set_collection(collection)
+    for max_concurrency in (0, -1):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await async_solr_client.delete_many(["1"], max_concurrency=max_concurrency)
+
+
 @pytest.mark.asyncio
 async def test_async_search_basic(
     async_solr_client: AsyncSolrClient, monkeypatch, sample_docs
@@ -368,6 +439,28 @@ def test_sync_add_multiple_documents(
     assert response["responseHeader"]["status"] == 0
 
 
+def test_sync_add_documents_streamed(
+    sync_solr_client: SolrClient, monkeypatch, sample_docs
+):
+    """Test adding documents with a streamed request body."""
+
+    def mock_request(*args, **kwargs):
+        assert kwargs["json"] is None
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+        body = b"".join(kwargs["content"])
+        expected_json = [doc.model_dump(exclude_unset=True) for doc in sample_docs]
+        assert json.loads(body) == expected_json
+        request = httpx.Request("POST", "http://localhost:8983", content=body)
+        response = Response(200, json=mock_update_response())
+        response._request = request
+        return response
+
+    monkeypatch.setattr(sync_solr_client._client, "request", mock_request)
+    sync_solr_client.set_collection(collection)
+    response = sync_solr_client.add(sample_docs, stream=True)
+    assert response["responseHeader"]["status"] == 0
+
+
 def test_sync_delete_by_ids(sync_solr_client: SolrClient, monkeypatch):
     """Test deleting documents by ID."""
     ids = ["1", "2"]
@@ -452,6 +545,100 @@ def test_sync_delete_combined(sync_solr_client: SolrClient, monkeypatch):
     assert response["responseHeader"]["status"] == 0
 
 
+def test_sync_delete_many(sync_solr_client: SolrClient, monkeypatch):
+    """Test deleting IDs in batches with a single commit at the end."""
+    ids = [str(i) for i in range(5)]
+    deleted = []
+    commits = []
+
+    def mock_request(*args, **kwargs):
+        if kwargs["json"] is None:
+            commits.append(kwargs["params"])
+        else:
+            assert kwargs["params"] == {}
+            deleted.append(kwargs["json"]["delete"])
+        request = httpx.Request("POST", "http://localhost:8983")
+        response = Response(200, json=mock_delete_response())
+        response._request = request
+        return response
+
+    monkeypatch.setattr(sync_solr_client._client, "request", mock_request)
+    sync_solr_client.set_collection(collection)
+    responses = sync_solr_client.delete_many(ids, batch_size=2)
+    assert len(responses) == 3
+    assert deleted == [["0", "1"], ["2", "3"], "4"]
+    assert commits == [{"commit": "true"}]
+
+
+@pytest.mark.parametrize("client_cls", [SolrClient, AsyncSolrClient])
+def test_client_passes_http2_option(client_cls, monkeypatch):
+    """Test that the http2 flag is forwarded to the httpx client."""
+    captured = {}
+    httpx_cls = httpx.Client if client_cls is SolrClient else httpx.AsyncClient
+
+    class CapturingClient(httpx_cls):
+        def __init__(self, **kwargs):
+            captured.update(kwargs)
+            kwargs["http2"] = False
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(httpx, httpx_cls.__name__, CapturingClient)
+    client_cls("http://localhost:8983/solr", http2=True)
+    assert captured["http2"] is True
+
+
+def test_sync_shared_transport():
+    """Test that clients reuse the shared transport and closing one keeps it open."""
+    transport = SolrClient.configure_shared_transport(retries=1)
+    try:
+        first = SolrClient("http://localhost:8983/solr")
+        second = SolrClient("http://localhost:8983/solr")
+        own = SolrClient(
+            "http://localhost:8983/solr",
+            transport=httpx.MockTransport(lambda r: Response(200)),
+        )
+        assert first._client._transport is transport
+        assert second._client._transport is transport
+        assert own._client._transport is not transport
+        first.close()
+        assert not second._client.is_closed
+        second.close()
+        own.close()
+    finally:
+        SolrClient.close_shared_transport()
+    assert SolrClient._shared_transport is None
+    assert AsyncSolrClient._shared_transport is None
+
+
+@pytest.mark.asyncio
+async def test_async_shared_transport():
+    """Test that async clients reuse the shared transport."""
+    transport = AsyncSolrClient.configure_shared_transport()
+    try:
+        first = AsyncSolrClient("http://localhost:8983/solr")
+        second = AsyncSolrClient("http://localhost:8983/solr")
+        assert first._client._transport is transport
+        assert second._client._transport is transport
+        await first.close()
+        await second.close()
+    finally:
+        await AsyncSolrClient.close_shared_transport()
+    assert AsyncSolrClient._shared_transport is None
+
+
+def test_shared_transport_http2_mismatch():
+    """Test that a client's http2 must match the shared transport."""
+    SolrClient.configure_shared_transport()
+    try:
+        with pytest.raises(ValueError):
+            SolrClient("http://localhost:8983/solr", http2=True)
+        client = SolrClient("http://localhost:8983/solr")
+        assert client._client._transport is SolrClient._shared_transport
+        client.close()
+    finally:
+        SolrClient.close_shared_transport()
+
+
 def test_sync_search_basic(sync_solr_client: SolrClient, monkeypatch, sample_docs):
     """Test basic search functionality."""
 
@@ -593,6 +780,44 @@ def test_base_solr_client_set_headers_dict():
     assert "B" not in client._client.headers
 
 
+def test_base_solr_client_build_search_response_validates_documents():
+    from pydantic import Field
+    from taiyo.types import SolrDocument
+
+    class AliasedDocument(SolrDocument):
+        doc_id: str = Field(alias="id")
+
+    response = BaseSolrClient._build_search_response(
+        {
+            "responseHeader": {"status": 0, "QTime": 1},
+            "response": {
+                "numFound": 2,
+                "start": 0,
+                "docs": [{"id": "1"}, {"doc_id": "2", "extra": True}],
+            },
+        },
+        AliasedDocument,
+    )
+    assert [doc.doc_id for doc in response.docs] == ["1", "2"]
+    assert response.docs[1].extra is True
+
+
+@pytest.mark.parametrize(
+    "query, ids, expected",
+    [
+        (None, "1", "1"),
+        (None, ["1"], "1"),
+        (None, ["1", "2"], ["1", "2"]),
+        ("*:*", None, {"query": "*:*"}),
+        ("*:*", [], {"query": "*:*"}),
+        ("*:*", "1", {"query": "*:*", "id": "1"}),
+        ("*:*", ["1", "2"], {"query": "*:*", "id": ["1", "2"]}),
+    ],
+)
+def test_base_solr_client_build_delete_command(query, ids, expected):
+    assert BaseSolrClient._build_delete_command(query=query, ids=ids) == expected
+
+
 @pytest.mark.asyncio
 async def test_async_add_field_type_with_schema_object(
     async_solr_client: AsyncSolrClient, monkeypatch